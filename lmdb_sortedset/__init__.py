@@ -9,8 +9,9 @@ Key Features:
 - High-performance memory-mapped storage
 - ACID transaction support
 - Composite key approach for efficient range queries
-- JSON serialization support
+- JSON serialization support, with optional orjson or msgpack member serializers
 - Context manager support for automatic cleanup
+- Pipelines for batching several commands into one transaction
 
 Example:
     >>> from lmdb_sortedset import LMDBSortedSet
@@ -30,8 +31,15 @@ Example:
 """
 
 from .sortedset import LMDBSortedSet
+from .pipeline import Pipeline
 from .exceptions import LMDBSortedSetError, LMDBInitError, LMDBOperationError
 
-__version__ = "0.1.0"
+__version__ = "0.2.0"
 __author__ = "Prashant"
-__all__ = ["LMDBSortedSet", "LMDBSortedSetError", "LMDBInitError", "LMDBOperationError"]
+__all__ = [
+    "LMDBSortedSet",
+    "Pipeline",
+    "LMDBSortedSetError",
+    "LMDBInitError",
+    "LMDBOperationError",
+]
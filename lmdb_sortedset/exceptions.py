@@ -6,16 +6,45 @@ Exception classes for LMDB SortedSet library.
 class LMDBSortedSetError(Exception):
     """Base exception for all LMDB SortedSet errors."""
 
-    pass
+    __slots__ = ()
 
 
 class LMDBInitError(LMDBSortedSetError):
     """Raised when LMDB initialization fails."""
 
-    pass
+    __slots__ = ()
 
 
 class LMDBOperationError(LMDBSortedSetError):
-    """Raised when an LMDB operation fails."""
-
-    pass
+    """
+    Raised when an LMDB operation fails.
+
+    Expected misses (e.g. ``zscore`` or ``zrank`` on an absent member) return
+    ``None`` instead of raising, so this is only raised for real failures.
+    """
+
+    __slots__ = ()
+
+    # Messages for the LMDB return codes most likely to surface at runtime
+    _RC_MESSAGES = {
+        -30799: "MDB_KEYEXIST: Key/data pair already exists",
+        -30798: "MDB_NOTFOUND: No matching key/data pair found",
+        -30792: "MDB_MAP_FULL: Environment mapsize limit reached",
+        -30791: "MDB_DBS_FULL: Environment maxdbs limit reached",
+        -30790: "MDB_READERS_FULL: Environment maxreaders limit reached",
+        -30788: "MDB_TXN_FULL: Transaction has too many dirty pages",
+        -30785: "MDB_MAP_RESIZED: Database contents grew beyond environment mapsize",
+    }
+
+    @classmethod
+    def from_rc(cls, rc: int) -> "LMDBOperationError":
+        """
+        Create an error for a raw LMDB return code.
+
+        Args:
+            rc: The LMDB return code (e.g. -30792 for MDB_MAP_FULL)
+
+        Returns:
+            LMDBOperationError: A new error with a message for the code
+        """
+        return cls(cls._RC_MESSAGES.get(rc, f"LMDB error code {rc}"))
@@ -0,0 +1,198 @@
+"""
+Pipelined command execution for LMDB SortedSet.
+
+A pipeline buffers sorted set commands and replays them inside a single LMDB
+write transaction, so a batch of small operations pays for one commit (and one
+fsync) instead of one per command.
+"""
+
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Sequence, Tuple, Union
+
+import lmdb
+
+from .exceptions import LMDBOperationError
+
+if TYPE_CHECKING:
+    from .sortedset import LMDBSortedSet
+
+
+class Pipeline:
+    """
+    Buffer sorted set commands and execute them in one write transaction.
+
+    Each queued command returns the pipeline itself so calls can be chained.
+    Results are returned by ``execute()`` in the order the commands were
+    queued. When used as a context manager, any commands still pending when
+    the block exits without an exception are executed automatically.
+
+    Example:
+        >>> with client.pipeline() as pipe:
+        >>>     pipe.zadd("ratelimit:user", {"req1": 100})
+        >>>     pipe.zremrangebyscore("ratelimit:user", 0, 40)
+        >>>     pipe.zcard("ratelimit:user")
+        >>>     added, removed, count = pipe.execute()
+    """
+
+    def __init__(self, client: "LMDBSortedSet"):
+        """
+        Initialize the pipeline.
+
+        Args:
+            client: The LMDBSortedSet client whose environment is used
+        """
+        self.client = client
+        self._commands: List[Tuple[Callable[..., Any], Tuple[Any, ...]]] = []
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit; executes pending commands unless an error occurred."""
+        if exc_type is None and self._commands:
+            self.execute()
+        self.reset()
+
+    def __len__(self) -> int:
+        """Return the number of queued commands."""
+        return len(self._commands)
+
+    def _queue(self, command: Callable[..., Any], *args: Any) -> "Pipeline":
+        """Queue a transaction-level command together with its arguments."""
+        self._commands.append((command, args))
+        return self
+
+    def reset(self):
+        """Discard all queued commands."""
+        self._commands = []
+
+    def execute(self) -> List[Any]:
+        """
+        Execute all queued commands in a single write transaction.
+
+        Returns:
+            list: The result of each command, in queue order
+
+        Raises:
+            LMDBOperationError: If the transaction fails; no command is applied
+        """
+        commands = self._commands
+        self.reset()
+        if not commands:
+            return []
+
+        try:
+            with self.client._begin_write() as txn:
+                return [command(txn, *args) for command, args in commands]
+
+        except lmdb.Error as e:
+            raise LMDBOperationError(f"Failed to execute pipeline: {e}") from e
+
+    def zadd(self, key: Union[str, bytes], score_dict: Dict[Any, Union[int, float]]) -> "Pipeline":
+        """Queue a ``zadd`` command."""
+        return self._queue(self.client._zadd, key, score_dict)
+
+    def zadd_many(
+        self, updates: Dict[Union[str, bytes], Dict[Any, Union[int, float]]]
+    ) -> "Pipeline":
+        """Queue a ``zadd_many`` command."""
+        return self._queue(self.client._zadd_many, updates)
+
+    def zadd_bulk(
+        self,
+        key: Union[str, bytes],
+        members: Sequence[Any],
+        scores: Sequence[Union[int, float]],
+    ) -> "Pipeline":
+        """Queue a ``zadd_bulk`` command."""
+        if len(members) != len(scores):
+            raise ValueError(
+                f"members and scores must have the same length ({len(members)} != {len(scores)})"
+            )
+        return self._queue(self.client._zadd_bulk, key, members, scores)
+
+    def zadd_sorted(
+        self, key: Union[str, bytes], items: Iterable[Tuple[Any, Union[int, float]]]
+    ) -> "Pipeline":
+        """Queue a ``zadd_sorted`` command."""
+        return self._queue(self.client._zadd_sorted, key, list(items))
+
+    def zincrby(
+        self, key: Union[str, bytes], member: Any, amount: Union[int, float] = 1
+    ) -> "Pipeline":
+        """Queue a ``zincrby`` command."""
+        return self._queue(self.client._zincrby, key, member, amount)
+
+    def zrange(
+        self, key: Union[str, bytes], start: int, stop: int, withscores: bool = False
+    ) -> "Pipeline":
+        """Queue a ``zrange`` command."""
+        return self._queue(self.client._zrange, key, start, stop, withscores)
+
+    def zrangebyscore(
+        self,
+        key: Union[str, bytes],
+        min_score: Union[int, float],
+        max_score: Union[int, float],
+        withscores: bool = False,
+    ) -> "Pipeline":
+        """Queue a ``zrangebyscore`` command."""
+        return self._queue(self.client._zrangebyscore, key, min_score, max_score, withscores)
+
+    def zrem(self, key: Union[str, bytes], *members: Any) -> "Pipeline":
+        """Queue a ``zrem`` command."""
+        return self._queue(self.client._zrem, key, *members)
+
+    def zcard(self, key: Union[str, bytes]) -> "Pipeline":
+        """Queue a ``zcard`` command."""
+        return self._queue(self.client._zcard, key)
+
+    def zscore(self, key: Union[str, bytes], member: Any) -> "Pipeline":
+        """Queue a ``zscore`` command."""
+        return self._queue(self.client._zscore, key, member)
+
+    def zmscore(self, key: Union[str, bytes], *members: Any) -> "Pipeline":
+        """Queue a ``zmscore`` command."""
+        return self._queue(self.client._zmscore, key, *members)
+
+    def zrank(self, key: Union[str, bytes], member: Any) -> "Pipeline":
+        """Queue a ``zrank`` command."""
+        return self._queue(self.client._zrank, key, member)
+
+    def zcount(
+        self,
+        key: Union[str, bytes],
+        min_score: Union[int, float],
+        max_score: Union[int, float],
+    ) -> "Pipeline":
+        """Queue a ``zcount`` command."""
+        return self._queue(self.client._zcount, key, min_score, max_score)
+
+    def zremrangebyscore(
+        self,
+        key: Union[str, bytes],
+        min_score: Union[int, float],
+        max_score: Union[int, float],
+    ) -> "Pipeline":
+        """Queue a ``zremrangebyscore`` command."""
+        return self._queue(self.client._zremrangebyscore, key, min_score, max_score)
+
+    def zpopmin(self, key: Union[str, bytes], count: int = 1) -> "Pipeline":
+        """Queue a ``zpopmin`` command."""
+        return self._queue(self.client._zpopmin, key, count)
+
+    def zpopmax(self, key: Union[str, bytes], count: int = 1) -> "Pipeline":
+        """Queue a ``zpopmax`` command."""
+        return self._queue(self.client._zpopmax, key, count)
+
+    def zpeekmin(self, key: Union[str, bytes], count: int = 1) -> "Pipeline":
+        """Queue a ``zpeekmin`` command."""
+        return self._queue(self.client._zpeekmin, key, count)
+
+    def zpeekmax(self, key: Union[str, bytes], count: int = 1) -> "Pipeline":
+        """Queue a ``zpeekmax`` command."""
+        return self._queue(self.client._zpeekmax, key, count)
+
+    def delete(self, key: Union[str, bytes]) -> "Pipeline":
+        """Queue a ``delete`` command."""
+        return self._queue(self.client._delete, key)
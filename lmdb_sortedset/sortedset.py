@@ -8,15 +8,116 @@ persistent storage and ACID transaction support.
 
 import lmdb
 import logging
-from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union, Any
-
-from .utils import encode_value, decode_value, encode_score, decode_score, format_key
+import functools
+import os
+import threading
+from contextlib import contextmanager
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union, Any
+
+from .utils import (
+    TAGGED_SERIALIZERS,
+    encode_value,
+    decode_value,
+    encode_value_tagged,
+    decode_value_tagged,
+    decode_score,
+    encode_score_orderable,
+    encode_scores_orderable,
+    decode_score_orderable,
+)
 from .exceptions import LMDBInitError, LMDBOperationError
-
+from .pipeline import Pipeline
 
 logger = logging.getLogger(__name__)
 
+# LMDB must not be opened more than once per process, so every client pointing
+# at the same directory shares one environment. Entries map the resolved path
+# to [environment, number of open clients]. A forked child closes what it
+# inherited and starts empty, since LMDB environments cannot cross fork().
+_environments: Dict[str, List[Any]] = {}
+_environments_lock = threading.RLock()
+
+# encode_value() has no encoding for None, so the json serializer rejects it
+_NONE_MEMBER = "None is not a valid sorted set member with the json serializer"
+
+# Environment options every client sharing an environment must agree on
+_SHARED_FLAGS = ("writemap", "metasync", "sync", "map_async", "readahead")
+
+
+def _acquire_environment(env_key: str, path: str, **kwargs: Any) -> lmdb.Environment:
+    """
+    Return the shared environment for a directory, opening it on first use.
+
+    Args:
+        env_key: Resolved path identifying the environment
+        path: Directory path passed to ``lmdb.open``
+        **kwargs: Options forwarded to ``lmdb.open`` when it is first opened
+
+    Returns:
+        lmdb.Environment: The shared environment
+    """
+    with _environments_lock:
+        entry = _environments.get(env_key)
+        if entry is None:
+            entry = [lmdb.open(path, **kwargs), 0]
+            _environments[env_key] = entry
+        else:
+            _check_environment_flags(entry[0], path, kwargs)
+        entry[1] += 1
+        return entry[0]
+
+
+def _check_environment_flags(env: lmdb.Environment, path: str, options: Dict[str, Any]) -> None:
+    """
+    Verify that a client's requested options match an already open environment.
+
+    A read-only client may share a writable environment (its writes are
+    refused per client), but not the other way round.
+
+    Args:
+        env: The open shared environment
+        path: Directory path, used in error messages
+        options: Options the joining client would have passed to ``lmdb.open``
+
+    Raises:
+        LMDBInitError: If the requested options conflict with the open environment
+    """
+    flags = env.flags()
+    if flags["readonly"] and not options["readonly"]:
+        raise LMDBInitError(
+            f"LMDB environment at {path} is already open read-only in this process; "
+            f"close its clients before opening it for writing"
+        )
+    mismatched = [name for name in _SHARED_FLAGS if flags[name] != options[name]]
+    if mismatched:
+        requested = ", ".join(f"{name}={options[name]}" for name in mismatched)
+        current = ", ".join(f"{name}={flags[name]}" for name in mismatched)
+        raise LMDBInitError(
+            f"LMDB environment at {path} is already open with {current}; "
+            f"cannot share it with a client requesting {requested}"
+        )
+
+
+def _release_environment(env_key: str, env: lmdb.Environment) -> None:
+    """
+    Drop one client reference to a shared environment, closing it when unused.
+
+    Args:
+        env_key: Resolved path identifying the environment
+        env: The environment the client acquired; references to an environment
+            that is no longer registered (e.g. one inherited across fork())
+            are ignored
+    """
+    with _environments_lock:
+        entry = _environments.get(env_key)
+        if entry is None or entry[0] is not env:
+            return
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del _environments[env_key]
+            entry[0].close()
+
 
 class LMDBSortedSet:
     """
@@ -28,14 +129,25 @@ class LMDBSortedSet:
 
     Key Design Decisions:
     1. Composite Keys: Sorted sets use keys in format 'prefix:key:score' for natural ordering
-    2. Binary Score Encoding: Scores are stored as big-endian doubles for consistent ordering
+    2. Binary Score Encoding: Scores are stored as order-preserving 8-byte doubles,
+       so keys sort by score, negative scores included
     3. ACID Transactions: All operations are transactional
     4. Context Manager: Supports automatic resource cleanup
+    5. Shared Environments: Clients on the same path share one LMDB environment,
+       and each client can use its own named sub-database
+    6. Cardinality Counters: A companion database keeps each set's size so zcard
+       is a single lookup
+    7. Member Index: A companion database maps each member to its score so zscore,
+       zrem and score updates are point lookups instead of set scans
 
     Attributes:
         env: LMDB environment instance
         zset_db: Database for sorted sets
+        count_db: Database mapping each sorted set key to its member count
+        member_db: Database mapping each member to its encoded score
+        serializer: Name of the member encoding ("json", "orjson" or "msgpack")
         SCORE_SEPARATOR: Byte separator for composite keys
+        MEMBER_SEPARATOR: Byte separator for member index keys
 
     Example:
         >>> with LMDBSortedSet(path="./data") as client:
@@ -47,6 +159,12 @@ class LMDBSortedSet:
     # Special token to separate score from value in sorted sets
     SCORE_SEPARATOR = b":|:"
 
+    # Separates the set key from the member in member index keys
+    MEMBER_SEPARATOR = b":|m:"
+
+    # Clients handed out by shared(), keyed by (resolved path, db_name, key_prefix)
+    _shared_clients: Dict[Tuple[str, str, str], "LMDBSortedSet"] = {}
+
     def __init__(
         self,
         path: str,
@@ -55,10 +173,23 @@ class LMDBSortedSet:
         key_prefix: str = "",
         readonly: bool = False,
         create: bool = True,
+        db_name: str = "zset",
+        writemap: bool = False,
+        metasync: bool = True,
+        readahead: bool = True,
+        sync: bool = True,
+        map_async: bool = False,
+        serializer: str = "json",
     ):
         """
         Initialize the LMDB sorted set client.
 
+        If another client already has an environment open for the same path,
+        it is reused. writemap, metasync, readahead, sync and map_async must
+        then match the open environment, and a writable client cannot join an
+        environment opened read-only; a read-only client may join a writable
+        one and has its writes refused.
+
         Args:
             path: Directory path for LMDB storage
             map_size: Maximum size of the database (default: 10GB)
@@ -66,41 +197,120 @@ class LMDBSortedSet:
             key_prefix: Optional prefix for all keys for namespace isolation
             readonly: Whether to open the database in read-only mode
             create: Whether to create the database if it doesn't exist
+            db_name: Named sub-database holding the sorted sets (default: "zset");
+                companion "<db_name>_count" and "<db_name>_member" databases are
+                also used, so allow three named databases per db_name in max_dbs
+            writemap: Write dirty pages straight through the memory map instead of
+                issuing a write() per page; faster for bulk writes, but a stray
+                pointer write in the process can corrupt the database, and on
+                some platforms (Windows, older Linux kernels and filesystems
+                without sparse files) the data file is grown to map_size up front
+            metasync: Flush the meta page on every commit; disabling it may lose
+                the last transaction on a system crash, but never corrupts data
+            readahead: Let the OS read ahead on the data file; disable it when the
+                database is larger than RAM to avoid polluting the page cache
+            sync: Flush data to disk on every commit; disabling it leaves flushing
+                to the OS (or to ``sync()``), so a system crash may undo recent
+                transactions, but the database stays consistent unless
+                writemap is also enabled on a filesystem that reorders writes
+            map_async: With writemap, flush asynchronously on commit (MS_ASYNC);
+                commits return sooner with the same durability caveats as
+                sync=False
+            serializer: How members are encoded (default: "json", where members
+                decode to strings). "orjson" or "msgpack" tag each member with
+                its type so it decodes to the original str, bytes, int, float,
+                dict or list, and serialize structured members in C. The
+                serializer is recorded on the first read-write open, and later
+                opens with a different one raise LMDBInitError
 
         Raises:
-            LMDBInitError: If LMDB initialization fails
+            ValueError: If the serializer is unknown
+            ImportError: If the serializer's optional package is not installed
+            LMDBInitError: If LMDB initialization fails, the options conflict
+                with an environment already open for the same path, the
+                db_name was written with a different serializer, or a 0.1
+                database is opened read-only before it has been migrated
         """
+        if serializer == "json":
+            self._encode_value = encode_value
+            self._decode_value = decode_value
+        elif serializer in TAGGED_SERIALIZERS:
+            if TAGGED_SERIALIZERS[serializer] is None:
+                raise ImportError(
+                    f"The {serializer!r} serializer requires the {serializer} package "
+                    f"(pip install lmdb-sortedset[{serializer}])"
+                )
+            self._encode_value = functools.partial(encode_value_tagged, serializer=serializer)
+            self._decode_value = decode_value_tagged
+        else:
+            raise ValueError(
+                f"Unknown serializer {serializer!r}; expected 'json', 'orjson' or 'msgpack'"
+            )
+
         self.path = path
+        self.readonly = readonly
+        self.serializer = serializer
         self.key_prefix = key_prefix
+        self._prefix_bytes = f"{key_prefix}:".encode("utf-8") if key_prefix else b""
+        self.db_name = db_name
         self.env = None
         self.zset_db = None
+        self.count_db = None
+        self.member_db = None
+        self._env_key = os.path.realpath(path)
 
         try:
-            # Ensure directory exists with proper permissions
-            path_obj = Path(path)
-            if create and not readonly:
-                path_obj.mkdir(parents=True, exist_ok=True)
-
-            # Initialize the LMDB environment
-            self.env = lmdb.open(
+            # Ensure directory exists with proper permissions; the isdir check
+            # spares the common reopen case a mkdir system call
+            if create and not readonly and not os.path.isdir(path):
+                os.makedirs(path, mode=0o755, exist_ok=True)
+
+            # Initialize (or reuse) the LMDB environment
+            self.env = _acquire_environment(
+                self._env_key,
                 path,
                 map_size=map_size,
                 max_dbs=max_dbs,
                 subdir=True,
-                metasync=True,
-                sync=True,
-                map_async=False,
+                metasync=metasync,
+                sync=sync,
+                map_async=map_async,
                 mode=0o755,
                 readonly=readonly,
                 create=create,
+                writemap=writemap,
+                readahead=readahead,
             )
 
-            # Create database for sorted sets
-            self.zset_db = self.env.open_db(b"zset")
+            # Create database for sorted sets, their cardinality counters and
+            # the member -> score index
+            self.zset_db = self.env.open_db(db_name.encode("utf-8"))
+            if readonly and not self._has_indexes():
+                self.close()
+                raise LMDBInitError(
+                    f"Database at {path} was written by lmdb-sortedset 0.1 and has not been "
+                    f"migrated yet; open it read-write once to migrate it"
+                )
+            self.count_db = self.env.open_db(f"{db_name}_count".encode("utf-8"))
+            self.member_db = self.env.open_db(f"{db_name}_member".encode("utf-8"))
+
+            if not readonly:
+                self._ensure_indexes()
+
+            stored_serializer = self._record_serializer()
+            if stored_serializer is not None and stored_serializer != serializer:
+                self.close()
+                raise LMDBInitError(
+                    f"Sorted sets in {db_name!r} at {path} were written with the "
+                    f"{stored_serializer!r} serializer; cannot open them with {serializer!r}"
+                )
 
-            logger.info(f"LMDB SortedSet initialized at: {path}")
+            logger.debug(f"LMDB SortedSet initialized at: {path}")
 
         except lmdb.Error as e:
+            if self.env is not None:
+                env, self.env = self.env, None
+                _release_environment(self._env_key, env)
             error_msg = f"LMDB initialization error: {e}. Path: {path}"
             logger.error(error_msg)
             if not readonly:
@@ -110,6 +320,153 @@ class LMDBSortedSet:
                 )
             raise LMDBInitError(error_msg) from e
 
+    def _has_indexes(self) -> bool:
+        """Return whether the counter and member index databases exist yet."""
+        with self.env.begin(write=False) as txn:
+            return all(
+                txn.get(f"{self.db_name}_{suffix}".encode("utf-8")) is not None
+                for suffix in ("count", "member")
+            )
+
+    def _record_serializer(self) -> Optional[str]:
+        """
+        Return the serializer recorded for this db_name, recording it on first use.
+
+        The name is kept under a reserved key in the main database, next to the
+        named database entries. Read-only clients never record it, so None
+        means no read-write client has opened this db_name yet.
+
+        Returns:
+            str or None: The serializer the sorted sets were written with
+        """
+        marker = f"{self.db_name}:serializer".encode("utf-8")
+        with self.env.begin(write=False) as txn:
+            stored = txn.get(marker)
+        if stored is None and not self.readonly:
+            with self.env.begin(write=True) as txn:
+                # Another process may have recorded it since the read above
+                txn.put(marker, self.serializer.encode("utf-8"), overwrite=False)
+                stored = txn.get(marker)
+        return stored.decode("utf-8") if stored is not None else None
+
+    def _ensure_indexes(self):
+        """
+        Build the cardinality counters and member index for older data.
+
+        The companion databases are only rebuilt when one of them is empty while
+        the sorted set database is not, so this is a cheap check on normal opens.
+        Composite keys in the 0.1 format (a plain big-endian double and no
+        member suffix) are rewritten with the order-preserving score encoding
+        and the member appended, so every entry can be found from its member
+        index record. A 0.1 update could leave a member's old entry behind, so
+        only the first (lowest-scored) entry per member is kept and the rest
+        are deleted.
+        """
+        with self.env.begin(write=False) as txn:
+            if not txn.stat(self.zset_db)["entries"]:
+                return
+            if txn.stat(self.count_db)["entries"] and txn.stat(self.member_db)["entries"]:
+                return
+
+        counts: Dict[bytes, int] = {}
+        legacy_keys = []
+        duplicate_keys = []
+        with self._begin_write() as txn:
+            txn.drop(self.count_db, delete=False)
+            txn.drop(self.member_db, delete=False)
+
+            for compound_key, value in txn.cursor(db=self.zset_db).iternext():
+                zset_key, score_part = compound_key.split(self.SCORE_SEPARATOR, 1)
+                score_bytes = score_part[:8]
+                legacy = score_part == score_bytes and value
+                if legacy:
+                    score_bytes = encode_score_orderable(decode_score(score_bytes))
+                member_key = self._member_key(zset_key, value)
+                if not txn.put(member_key, score_bytes, db=self.member_db, overwrite=False):
+                    duplicate_keys.append(compound_key)
+                    continue
+                if legacy:
+                    legacy_keys.append(compound_key)
+                counts[zset_key] = counts.get(zset_key, 0) + 1
+
+            for compound_key in duplicate_keys:
+                txn.delete(compound_key, db=self.zset_db)
+            for compound_key in legacy_keys:
+                value = txn.pop(compound_key, db=self.zset_db)
+                zset_key, score_part = compound_key.split(self.SCORE_SEPARATOR, 1)
+                score_bytes = encode_score_orderable(decode_score(score_part))
+                txn.put(
+                    zset_key + self.SCORE_SEPARATOR + score_bytes + value, value, db=self.zset_db
+                )
+            for zset_key, count in counts.items():
+                txn.put(zset_key, count.to_bytes(8, "big"), db=self.count_db)
+
+        if duplicate_keys:
+            logger.warning(f"Dropped {len(duplicate_keys)} duplicate member entries left by 0.1")
+        logger.info(f"Rebuilt cardinality counters and member index for {len(counts)} sorted sets")
+
+    def _bump_count(self, txn: lmdb.Transaction, zset_key: bytes, delta: int) -> None:
+        """
+        Adjust a sorted set's stored member count inside a write transaction.
+
+        Args:
+            txn: The write transaction
+            zset_key: The formatted sorted set key
+            delta: Number of members added (positive) or removed (negative)
+        """
+        if not delta:
+            return
+        raw = txn.get(zset_key, db=self.count_db)
+        count = (int.from_bytes(raw, "big") if raw else 0) + delta
+        if count > 0:
+            txn.put(zset_key, count.to_bytes(8, "big"), db=self.count_db)
+        else:
+            txn.delete(zset_key, db=self.count_db)
+
+    @classmethod
+    def shared(
+        cls, path: str, db_name: str = "zset", key_prefix: str = "", **kwargs: Any
+    ) -> "LMDBSortedSet":
+        """
+        Return a process-wide client for a path and sub-database.
+
+        The first call creates the client; later calls with the same path,
+        db_name and key_prefix return that same open client. Use
+        ``close_shared()`` to close every client created this way.
+
+        Args:
+            path: Directory path for LMDB storage
+            db_name: Named sub-database holding the sorted sets (default: "zset")
+            key_prefix: Optional prefix for all keys for namespace isolation
+            **kwargs: Extra constructor arguments used when the client is created
+
+        Returns:
+            LMDBSortedSet: The shared client
+
+        Raises:
+            LMDBInitError: If LMDB initialization fails
+
+        Example:
+            >>> leaderboard = LMDBSortedSet.shared("./data", db_name="leaderboard")
+            >>> tasks = LMDBSortedSet.shared("./data", db_name="tasks")  # same environment
+        """
+        cache_key = (os.path.realpath(path), db_name, key_prefix)
+        with _environments_lock:
+            client = cls._shared_clients.get(cache_key)
+            if client is None or client.env is None:
+                client = cls(path, db_name=db_name, key_prefix=key_prefix, **kwargs)
+                cls._shared_clients[cache_key] = client
+            return client
+
+    @classmethod
+    def close_shared(cls):
+        """Close every client created by ``shared()``."""
+        with _environments_lock:
+            clients = list(cls._shared_clients.values())
+            cls._shared_clients.clear()
+        for client in clients:
+            client.close()
+
     def __enter__(self):
         """Context manager entry."""
         return self
@@ -118,6 +475,12 @@ class LMDBSortedSet:
         """Context manager exit with automatic cleanup."""
         self.close()
 
+    def _begin_write(self) -> lmdb.Transaction:
+        """Begin a write transaction, refusing it for read-only clients."""
+        if self.readonly:
+            raise lmdb.ReadonlyError(f"Cannot write through a read-only client: {self.path}")
+        return self.env.begin(db=self.zset_db, write=True)
+
     def _format_key(self, key: Union[str, bytes]) -> bytes:
         """
         Format a key with the global prefix for namespace isolation.
@@ -128,40 +491,92 @@ class LMDBSortedSet:
         Returns:
             bytes: The formatted key with prefix
         """
-        return format_key(key, self.key_prefix)
+        # Same result as format_key(), with the encoded prefix cached per client
+        return self._prefix_bytes + (key if isinstance(key, bytes) else key.encode("utf-8"))
+
+    def _member_key(self, zset_key: bytes, encoded_member: bytes) -> bytes:
+        """
+        Create the member index key for a member of a sorted set.
+
+        Args:
+            zset_key: The formatted sorted set key
+            encoded_member: The encoded member
+
+        Returns:
+            bytes: The member index key
+        """
+        return zset_key + self.MEMBER_SEPARATOR + encoded_member
 
-    def _zset_key(self, key: Union[str, bytes], score: Union[int, float]) -> bytes:
+    @staticmethod
+    def _upper_bound(prefix: bytes) -> bytes:
         """
-        Create a composite key for sorted set that ensures ordering by score.
+        Return the smallest key that sorts after every key starting with prefix.
 
-        The composite key format is: 'prefix:key:|:score' where score is encoded
-        as a big-endian double. This ensures natural ordering by score when
-        iterating through keys.
+        Scans stop once a key reaches this bound, which is a single bytes
+        comparison instead of a prefix check on every step.
 
         Args:
-            key: The sorted set key
-            score: The score value
+            prefix: A key prefix that does not consist only of 0xff bytes
+
+        Returns:
+            bytes: The exclusive upper bound for keys starting with prefix
+        """
+        stem = prefix.rstrip(b"\xff")
+        return stem[:-1] + bytes([stem[-1] + 1])
+
+    @staticmethod
+    def _seek_last(cursor: lmdb.Cursor, prefix: bytes) -> bool:
+        """
+        Position a cursor on the last (highest-scored) entry of a sorted set.
+
+        Args:
+            cursor: Cursor on the sorted set database
+            prefix: The set's formatted key followed by SCORE_SEPARATOR
 
         Returns:
-            bytes: The composite key
+            bool: True if the set has at least one entry
         """
-        formatted_key = self._format_key(key)
-        score_bytes = encode_score(score)
-        return formatted_key + self.SCORE_SEPARATOR + score_bytes
+        if cursor.set_range(LMDBSortedSet._upper_bound(prefix)):
+            if not cursor.prev():
+                return False
+        elif not cursor.last():
+            return False
+        return cursor.key().startswith(prefix)
 
-    def _extract_from_zset_key(self, compound_key: bytes) -> Tuple[bytes, float]:
+    def _take(
+        self,
+        entries: Iterator[Any],
+        limit: int,
+        prefix_len: int,
+        withscores: bool,
+    ) -> Union[List[Any], List[Tuple[Any, float]]]:
         """
-        Extract original key and score from compound key.
+        Decode a known number of consecutive entries from a cursor iterator.
+
+        The caller bounds ``limit`` by the set's stored member count, so every
+        entry taken belongs to the set and no per-entry prefix check is needed.
+        Slicing and decoding then run inside ``islice`` and ``map`` or a
+        comprehension rather than as a hand-written loop per entry.
 
         Args:
-            compound_key: The composite key from sorted set
+            entries: Cursor iterator positioned on the first entry to consider,
+                yielding (key, value) pairs, or just values when withscores=False
+            limit: Number of entries to return
+            prefix_len: Length of the set's prefix, where the score begins
+            withscores: Whether to return (member, score) tuples
 
         Returns:
-            tuple: (original_key, score)
+            list: Members, or (member, score) tuples if withscores=True
         """
-        key_part, score_part = compound_key.split(self.SCORE_SEPARATOR, 1)
-        score = decode_score(score_part)
-        return key_part, score
+        taken = islice(entries, limit)
+        if not withscores:
+            return list(map(self._decode_value, taken))
+
+        score_end = prefix_len + 8
+        return [
+            (self._decode_value(value), decode_score_orderable(compound_key[prefix_len:score_end]))
+            for compound_key, value in taken
+        ]
 
     def zadd(self, key: Union[str, bytes], score_dict: Dict[Any, Union[int, float]]) -> int:
         """
@@ -176,45 +591,351 @@ class LMDBSortedSet:
 
         Raises:
             LMDBOperationError: If the operation fails
+            ValueError: If a member is None with the json serializer
 
         Example:
             >>> client.zadd("leaderboard", {"player1": 100, "player2": 200})
             2
         """
         try:
-            result = 0
-            zset_key = self._format_key(key)
-
-            with self.env.begin(db=self.zset_db, write=True) as txn:
-                for member, score in score_dict.items():
-                    encoded_value = encode_value(member)
-
-                    # First, remove any existing entries for this member
-                    cursor = txn.cursor()
-                    if cursor.set_range(zset_key):
-                        for compound_key, stored_value in cursor:
-                            if not compound_key.startswith(zset_key + self.SCORE_SEPARATOR):
-                                break
-                            if stored_value == encoded_value:
-                                cursor.delete()
-                                break
-
-                    # Now add the member with the new score
-                    compound_key = self._zset_key(key, score)
-                    txn.put(compound_key, encoded_value)
-                    result += 1
-
-            return result
+            with self._begin_write() as txn:
+                return self._zadd(txn, key, score_dict)
 
         except lmdb.Error as e:
             raise LMDBOperationError(f"Failed to add members to sorted set: {e}") from e
 
+    def _zadd(
+        self,
+        txn: lmdb.Transaction,
+        key: Union[str, bytes],
+        score_dict: Dict[Any, Union[int, float]],
+    ) -> int:
+        """Add members to a sorted set inside an existing write transaction."""
+        return self._zadd_items(txn, key, score_dict.items())
+
+    def _zadd_items(
+        self,
+        txn: lmdb.Transaction,
+        key: Union[str, bytes],
+        items: Iterable[Tuple[Any, Union[int, float]]],
+    ) -> int:
+        """Add (member, score) pairs to a sorted set inside an existing write transaction."""
+        zset_key = self._format_key(key)
+        pending = self._encode_pending(items)
+        result = len(pending)
+
+        existing = self._drop_stale_members(txn, zset_key, pending)
+        if pending:
+            self._put_sorted(txn, zset_key, pending)
+        self._bump_count(txn, zset_key, result - existing)
+
+        return result
+
+    def _encode_pending(self, items: Iterable[Tuple[Any, Union[int, float]]]) -> Dict[bytes, bytes]:
+        """
+        Encode (member, score) pairs for writing, packing every score exactly once.
+
+        Later pairs win for repeated members, as with a dict passed to zadd.
+
+        Args:
+            items: (member, score) pairs
+
+        Returns:
+            dict: Mapping of encoded member to its 8-byte encoded score
+        """
+        scores = {self._encode_value(member): score for member, score in items}
+        if None in scores:
+            raise ValueError(_NONE_MEMBER)
+        # Pack every score in one call and slice the buffer instead of
+        # calling encode_score_orderable() per member
+        packed = encode_scores_orderable(scores.values())
+        score_list = [packed[offset : offset + 8] for offset in range(0, len(packed), 8)]
+        return dict(zip(scores, score_list))
+
+    def _drop_stale_members(
+        self, txn: lmdb.Transaction, zset_key: bytes, pending: Dict[bytes, bytes]
+    ) -> int:
+        """
+        Remove existing entries for members about to be written.
+
+        Each member's current score is looked up in the member index, so only
+        the stale composite keys are touched. Members whose stored score already
+        equals the pending score are left in place and removed from ``pending``,
+        so they are not rewritten.
+
+        Args:
+            txn: The write transaction
+            zset_key: The formatted sorted set key
+            pending: Mapping of encoded member to its new encoded score; updated
+                in place
+
+        Returns:
+            int: Number of pending members that already existed in the set
+        """
+        existing = 0
+        prefix = zset_key + self.SCORE_SEPARATOR
+        member_prefix = zset_key + self.MEMBER_SEPARATOR
+        member_db = self.member_db
+        for value in list(pending):
+            score_bytes = txn.get(member_prefix + value, db=member_db)
+            if score_bytes is None:
+                continue
+            existing += 1
+            if score_bytes == pending[value]:
+                del pending[value]
+            else:
+                txn.delete(prefix + score_bytes + value, db=self.zset_db)
+
+        return existing
+
+    def zadd_many(self, updates: Dict[Union[str, bytes], Dict[Any, Union[int, float]]]) -> int:
+        """
+        Add members to many sorted sets in a single write transaction.
+
+        Equivalent to calling ``zadd`` once per set, but all sets are written
+        under one commit (and one fsync), which makes bulk imports across many
+        sets far cheaper. The batch is all-or-nothing: if any set fails,
+        none are written, and the write lock is held until the whole batch is
+        done.
+
+        Args:
+            updates: Mapping of sorted set key to a member -> score dictionary
+
+        Returns:
+            int: Total number of members added/updated across all sets
+
+        Raises:
+            LMDBOperationError: If the operation fails
+            ValueError: If a member is None with the json serializer
+
+        Example:
+            >>> client.zadd_many({"board:1": {"alice": 10}, "board:2": {"bob": 20, "eve": 5}})
+            3
+        """
+        try:
+            with self._begin_write() as txn:
+                return self._zadd_many(txn, updates)
+
+        except lmdb.Error as e:
+            raise LMDBOperationError(f"Failed to add members to sorted sets: {e}") from e
+
+    def _zadd_many(
+        self,
+        txn: lmdb.Transaction,
+        updates: Dict[Union[str, bytes], Dict[Any, Union[int, float]]],
+    ) -> int:
+        """Add members to many sorted sets inside an existing write transaction."""
+        return sum(self._zadd(txn, key, score_dict) for key, score_dict in updates.items())
+
+    def zadd_bulk(
+        self,
+        key: Union[str, bytes],
+        members: Sequence[Any],
+        scores: Sequence[Union[int, float]],
+    ) -> int:
+        """
+        Add many members to a sorted set from parallel member and score sequences.
+
+        Existing entries for the members are found through the member index,
+        and the new composite keys are sorted and written with one
+        ``putmulti`` call. When the whole batch sorts after the last key in the
+        database (e.g. a new set, or appending later timestamps) LMDB's
+        append mode is used, which fills pages sequentially without searching
+        the tree for each key. Any sequence type works, including NumPy arrays.
+
+        Args:
+            key: The sorted set key
+            members: Members to add
+            scores: Score for each member, in the same order as ``members``
+
+        Returns:
+            int: Number of members added/updated
+
+        Raises:
+            ValueError: If ``members`` and ``scores`` differ in length, or a member
+                is None with the json serializer
+            LMDBOperationError: If the operation fails
+
+        Example:
+            >>> client.zadd_bulk("leaderboard", ["player1", "player2"], [100, 200])
+            2
+        """
+        if len(members) != len(scores):
+            raise ValueError(
+                f"members and scores must have the same length ({len(members)} != {len(scores)})"
+            )
+
+        try:
+            with self._begin_write() as txn:
+                return self._zadd_bulk(txn, key, members, scores)
+
+        except lmdb.Error as e:
+            raise LMDBOperationError(f"Failed to bulk add members to sorted set: {e}") from e
+
+    def _zadd_bulk(
+        self,
+        txn: lmdb.Transaction,
+        key: Union[str, bytes],
+        members: Sequence[Any],
+        scores: Sequence[Union[int, float]],
+    ) -> int:
+        """Bulk add members to a sorted set inside an existing write transaction."""
+        return self._zadd_items(txn, key, zip(members, scores))
+
+    def zadd_sorted(
+        self, key: Union[str, bytes], items: Iterable[Tuple[Any, Union[int, float]]]
+    ) -> int:
+        """
+        Load an empty sorted set from (member, score) pairs.
+
+        Intended for initial bulk loads: because the set is known to be empty,
+        no existing entries need to be looked up, and the composite keys are
+        written in ascending order so LMDB fills pages sequentially (using
+        MDB_APPEND when the set sorts after every other key in the database).
+        Pairs already in score order are sorted in linear time.
+
+        Args:
+            key: The sorted set key
+            items: (member, score) pairs, ideally in ascending score order
+
+        Returns:
+            int: Number of members added
+
+        Raises:
+            LMDBOperationError: If the sorted set is not empty or the operation fails
+            ValueError: If a member is None with the json serializer
+
+        Example:
+            >>> client.zadd_sorted("leaderboard", [("player1", 100), ("player2", 200)])
+            2
+        """
+        try:
+            with self._begin_write() as txn:
+                return self._zadd_sorted(txn, key, items)
+
+        except lmdb.Error as e:
+            raise LMDBOperationError(f"Failed to load sorted set: {e}") from e
+
+    def _zadd_sorted(
+        self,
+        txn: lmdb.Transaction,
+        key: Union[str, bytes],
+        items: Iterable[Tuple[Any, Union[int, float]]],
+    ) -> int:
+        """Load an empty sorted set inside an existing write transaction."""
+        zset_key = self._format_key(key)
+        prefix = zset_key + self.SCORE_SEPARATOR
+
+        cursor = txn.cursor(db=self.zset_db)
+        if cursor.set_range(prefix) and cursor.key().startswith(prefix):
+            raise LMDBOperationError(
+                f"Cannot load sorted set {key!r} with zadd_sorted: it is not empty"
+            )
+
+        pending = self._encode_pending(items)
+        if not pending:
+            return 0
+
+        self._put_sorted(txn, zset_key, pending)
+        self._bump_count(txn, zset_key, len(pending))
+        return len(pending)
+
+    def _put_sorted(
+        self, txn: lmdb.Transaction, zset_key: bytes, pending: Dict[bytes, bytes]
+    ) -> None:
+        """
+        Write encoded members and their scores in ascending key order.
+
+        Args:
+            txn: The write transaction
+            zset_key: The formatted sorted set key
+            pending: Mapping of encoded member to encoded score; must not be empty
+        """
+        prefix = zset_key + self.SCORE_SEPARATOR
+        items = sorted(
+            (prefix + score_bytes + value, value) for value, score_bytes in pending.items()
+        )
+
+        # MDB_APPEND silently skips keys that don't sort after the last key in
+        # the database, so only use it when the whole batch lands at the end
+        cursor = txn.cursor(db=self.zset_db)
+        append = not cursor.last() or cursor.key() < items[0][0]
+        cursor.putmulti(items, append=append)
+
+        member_prefix = zset_key + self.MEMBER_SEPARATOR
+        member_items = sorted(
+            (member_prefix + value, score_bytes) for value, score_bytes in pending.items()
+        )
+        txn.cursor(db=self.member_db).putmulti(member_items)
+
+    def zincrby(self, key: Union[str, bytes], member: Any, amount: Union[int, float] = 1) -> float:
+        """
+        Increment the score of a member in a sorted set.
+
+        The read of the current score and the write of the new one happen in a
+        single write transaction, so concurrent increments cannot be lost. A
+        member that does not exist yet is added with ``amount`` as its score.
+
+        Args:
+            key: The sorted set key
+            member: The member whose score to increment
+            amount: Value to add to the current score (default: 1)
+
+        Returns:
+            float: The new score of the member
+
+        Raises:
+            LMDBOperationError: If the operation fails
+            ValueError: If a member is None with the json serializer
+
+        Example:
+            >>> client.zincrby("cache:items", "item3", 1)
+            4.0
+        """
+        try:
+            with self._begin_write() as txn:
+                return self._zincrby(txn, key, member, amount)
+
+        except lmdb.Error as e:
+            raise LMDBOperationError(f"Failed to increment score: {e}") from e
+
+    def _zincrby(
+        self,
+        txn: lmdb.Transaction,
+        key: Union[str, bytes],
+        member: Any,
+        amount: Union[int, float] = 1,
+    ) -> float:
+        """Increment a member's score inside an existing write transaction."""
+        zset_key = self._format_key(key)
+        encoded_value = self._encode_value(member)
+        if encoded_value is None:
+            raise ValueError(_NONE_MEMBER)
+        member_key = self._member_key(zset_key, encoded_value)
+
+        score_bytes = txn.get(member_key, db=self.member_db)
+        score = decode_score_orderable(score_bytes) if score_bytes is not None else 0.0
+
+        new_score = score + amount
+        if score_bytes is None or new_score != score:
+            prefix = zset_key + self.SCORE_SEPARATOR
+            if score_bytes is not None:
+                txn.delete(prefix + score_bytes + encoded_value, db=self.zset_db)
+            else:
+                self._bump_count(txn, zset_key, 1)
+            new_score_bytes = encode_score_orderable(new_score)
+            txn.put(prefix + new_score_bytes + encoded_value, encoded_value, db=self.zset_db)
+            txn.put(member_key, new_score_bytes, db=self.member_db)
+        return new_score
+
     def zrange(
         self,
         key: Union[str, bytes],
         start: int,
         stop: int,
         withscores: bool = False,
+        *,
+        txn: Optional[lmdb.Transaction] = None,
     ) -> Union[List[Any], List[Tuple[Any, float]]]:
         """
         Get a range of elements from a sorted set by index.
@@ -224,6 +945,8 @@ class LMDBSortedSet:
             start: Start index (0-based)
             stop: Stop index (inclusive, -1 for end)
             withscores: Whether to include scores in results
+            txn: Transaction to read in, e.g. from ``read_batch()``; a new read
+                transaction is used when omitted
 
         Returns:
             list: List of members or (member, score) tuples if withscores=True
@@ -236,51 +959,55 @@ class LMDBSortedSet:
             [('player1', 100.0), ('player2', 200.0)]
         """
         try:
-            results = []
-            zset_key = self._format_key(key)
-
-            with self.env.begin(db=self.zset_db, write=False) as txn:
-                cursor = txn.cursor()
-                if cursor.set_range(zset_key):
-                    # First, check if we have any data
-                    compound_key = cursor.key()
-                    if not compound_key.startswith(zset_key + self.SCORE_SEPARATOR):
-                        return results
-
-                    # Collect all items first to handle negative indices
-                    all_items = []
-                    for compound_key, value in cursor.iternext():
-                        if not compound_key.startswith(zset_key + self.SCORE_SEPARATOR):
-                            break
-                        _, score = self._extract_from_zset_key(compound_key)
-                        all_items.append((decode_value(value), score))
-
-                    # Handle negative indices
-                    if stop == -1:
-                        stop = len(all_items) - 1
-                    if start < 0:
-                        start = max(0, len(all_items) + start)
-                    if stop < 0:
-                        stop = max(0, len(all_items) + stop)
-
-                    # Slice the results
-                    for item in all_items[start : stop + 1]:
-                        if withscores:
-                            results.append(item)
-                        else:
-                            results.append(item[0])
-
-            return results
+            if txn is None:
+                with self.env.begin(db=self.zset_db, write=False) as txn:
+                    return self._zrange(txn, key, start, stop, withscores)
+            return self._zrange(txn, key, start, stop, withscores)
 
         except lmdb.Error as e:
             raise LMDBOperationError(f"Failed to get range from sorted set: {e}") from e
 
+    def _zrange(
+        self,
+        txn: lmdb.Transaction,
+        key: Union[str, bytes],
+        start: int,
+        stop: int,
+        withscores: bool = False,
+    ) -> Union[List[Any], List[Tuple[Any, float]]]:
+        """Get a range of elements by index inside an existing transaction."""
+        zset_key = self._format_key(key)
+        prefix = zset_key + self.SCORE_SEPARATOR
+        prefix_len = len(prefix)
+
+        # Negative indices count from the end; the stored size also clamps stop
+        length = self._count(txn, zset_key)
+        if start < 0:
+            start = max(0, length + start)
+        if stop < 0:
+            stop = length + stop
+        stop = min(stop, length - 1)
+        if stop < start:
+            return []
+
+        cursor = txn.cursor(db=self.zset_db)
+        cursor.set_range(prefix)
+
+        # Skip entries before start without creating key or value objects
+        for _ in range(start):
+            cursor.next()
+
+        entries = cursor.iternext() if withscores else cursor.iternext(keys=False)
+        return self._take(entries, stop - start + 1, prefix_len, withscores)
+
     def zrangebyscore(
         self,
         key: Union[str, bytes],
         min_score: Union[int, float],
         max_score: Union[int, float],
         withscores: bool = False,
+        *,
+        txn: Optional[lmdb.Transaction] = None,
     ) -> Union[List[Any], List[Tuple[Any, float]]]:
         """
         Get members in a sorted set with scores within the given range.
@@ -290,6 +1017,8 @@ class LMDBSortedSet:
             min_score: Minimum score (inclusive)
             max_score: Maximum score (inclusive)
             withscores: Whether to include scores in results
+            txn: Transaction to read in, e.g. from ``read_batch()``; a new read
+                transaction is used when omitted
 
         Returns:
             list: List of members or (member, score) tuples if withscores=True
@@ -302,37 +1031,62 @@ class LMDBSortedSet:
             ['player1', 'player2']
         """
         try:
-            results = []
-            zset_key = self._format_key(key)
-            min_compound = self._zset_key(key, min_score)
-
-            with self.env.begin(db=self.zset_db, write=False) as txn:
-                cursor = txn.cursor()
-                if cursor.set_range(min_compound):
-                    for compound_key, value in cursor:
-                        # Check if we're still in the same sorted set
-                        if not compound_key.startswith(zset_key + self.SCORE_SEPARATOR):
-                            break
-
-                        # Extract the score and check if it's within range
-                        _, score = self._extract_from_zset_key(compound_key)
-                        if score > max_score:
-                            break
-
-                        if withscores:
-                            results.append((decode_value(value), score))
-                        else:
-                            results.append(decode_value(value))
-
-            return results
+            if txn is None:
+                with self.env.begin(db=self.zset_db, write=False) as txn:
+                    return self._zrangebyscore(txn, key, min_score, max_score, withscores)
+            return self._zrangebyscore(txn, key, min_score, max_score, withscores)
 
         except lmdb.Error as e:
             raise LMDBOperationError(f"Failed to get range by score: {e}") from e
 
+    def _zrangebyscore(
+        self,
+        txn: lmdb.Transaction,
+        key: Union[str, bytes],
+        min_score: Union[int, float],
+        max_score: Union[int, float],
+        withscores: bool = False,
+    ) -> Union[List[Any], List[Tuple[Any, float]]]:
+        """Get members by score range inside an existing transaction."""
+        results = []
+        prefix = self._format_key(key) + self.SCORE_SEPARATOR
+        prefix_len = len(prefix)
+        score_end = prefix_len + 8
+        min_compound = prefix + encode_score_orderable(min_score)
+        # Keys scored max_score carry a member suffix, so bound past all of them
+        stop_key = self._upper_bound(prefix + encode_score_orderable(max_score))
+
+        # This is the hottest read loop, so keep per-item work to plain local
+        # lookups and slicing the score straight out of the composite key
+        append = results.append
+        decode = self._decode_value
+        cursor = txn.cursor(db=self.zset_db)
+        if cursor.set_range(min_compound):
+            for compound_key, value in cursor.iternext():
+                # Past max_score, or past the end of this sorted set
+                if compound_key >= stop_key:
+                    break
+
+                if withscores:
+                    score = decode_score_orderable(compound_key[prefix_len:score_end])
+                    append((decode(value), score))
+                else:
+                    append(decode(value))
+
+        return results
+
     def zrem(self, key: Union[str, bytes], *members: Any) -> int:
         """
         Remove one or more members from a sorted set.
 
+        Members are first looked up in a read-only transaction, so a call that
+        matches nothing never takes the LMDB write lock, and the write
+        transaction only handles members that were found. Each removal is
+        still re-checked against the member index under the write lock, so
+        concurrent score updates cannot leave stale entries behind; a member
+        added by another writer between the two phases is simply not removed,
+        as if this call had run first.
+
         Args:
             key: The sorted set key
             *members: One or more members to remove
@@ -342,42 +1096,65 @@ class LMDBSortedSet:
 
         Raises:
             LMDBOperationError: If the operation fails
+            ValueError: If a member is None with the json serializer
 
         Example:
             >>> client.zrem("leaderboard", "player1", "player2")
             2
         """
         try:
-            zset_key = self._format_key(key)
-            removed = 0
-
-            with self.env.begin(db=self.zset_db, write=True) as txn:
-                for member in members:
-                    encoded_value = encode_value(member)
-                    cursor = txn.cursor()
-
-                    if cursor.set_range(zset_key):
-                        for compound_key, stored_value in cursor:
-                            # Check if we're still in the same sorted set
-                            if not compound_key.startswith(zset_key + self.SCORE_SEPARATOR):
-                                break
-
-                            if stored_value == encoded_value:
-                                cursor.delete()
-                                removed += 1
-                                break
+            with self.env.begin(db=self.zset_db, write=False) as txn:
+                scores = self._zmscore(txn, key, *members)
+            present = [member for member, score in zip(members, scores) if score is not None]
+            if not present:
+                return 0
 
-            return removed
+            with self._begin_write() as txn:
+                return self._zrem(txn, key, *present)
 
         except lmdb.Error as e:
             raise LMDBOperationError(f"Failed to remove members from sorted set: {e}") from e
 
-    def zcard(self, key: Union[str, bytes]) -> int:
+    def _zrem(self, txn: lmdb.Transaction, key: Union[str, bytes], *members: Any) -> int:
+        """Remove members from a sorted set inside an existing write transaction."""
+        zset_key = self._format_key(key)
+        prefix = zset_key + self.SCORE_SEPARATOR
+        member_prefix = zset_key + self.MEMBER_SEPARATOR
+        removed = 0
+
+        # Repeated members are looked up once, and lookups stop as soon as
+        # every member of the set has been removed. Probing the member index in
+        # key order keeps consecutive lookups on neighbouring B+tree pages.
+        size = self._count(txn, zset_key)
+        unique = {self._encode_value(member) for member in members}
+        if None in unique:
+            raise ValueError(_NONE_MEMBER)
+        wanted = sorted(unique)
+
+        cursor = txn.cursor(db=self.member_db)
+        for encoded_value in wanted:
+            if removed >= size:
+                break
+            if cursor.set_key(member_prefix + encoded_value):
+                score_bytes = cursor.value()
+                cursor.delete()
+                txn.delete(prefix + score_bytes + encoded_value, db=self.zset_db)
+                removed += 1
+
+        self._bump_count(txn, zset_key, -removed)
+        return removed
+
+    def zcard(self, key: Union[str, bytes], *, txn: Optional[lmdb.Transaction] = None) -> int:
         """
         Get the number of members in a sorted set.
 
+        The size is read from a counter maintained by every write, so this is a
+        single lookup regardless of how many members the set has.
+
         Args:
             key: The sorted set key
+            txn: Transaction to read in, e.g. from ``read_batch()``; a new read
+                transaction is used when omitted
 
         Returns:
             int: Number of members
@@ -390,65 +1167,181 @@ class LMDBSortedSet:
             5
         """
         try:
-            count = 0
-            zset_key = self._format_key(key)
-
-            with self.env.begin(db=self.zset_db, write=False) as txn:
-                cursor = txn.cursor()
-                if cursor.set_range(zset_key):
-                    for compound_key, _ in cursor:
-                        if not compound_key.startswith(zset_key + self.SCORE_SEPARATOR):
-                            break
-                        count += 1
-
-            return count
+            if txn is None:
+                with self.env.begin(db=self.zset_db, write=False) as txn:
+                    return self._zcard(txn, key)
+            return self._zcard(txn, key)
 
         except lmdb.Error as e:
             raise LMDBOperationError(f"Failed to get cardinality: {e}") from e
 
-    def zscore(self, key: Union[str, bytes], member: Any) -> Optional[float]:
+    def _zcard(self, txn: lmdb.Transaction, key: Union[str, bytes]) -> int:
+        """Count the members of a sorted set inside an existing transaction."""
+        return self._count(txn, self._format_key(key))
+
+    def _count(self, txn: lmdb.Transaction, zset_key: bytes) -> int:
+        """Read the stored member count for a formatted sorted set key."""
+        raw = txn.get(zset_key, db=self.count_db)
+        return int.from_bytes(raw, "big") if raw else 0
+
+    def zscore(
+        self, key: Union[str, bytes], member: Any, *, txn: Optional[lmdb.Transaction] = None
+    ) -> Optional[float]:
         """
         Get the score of a member in a sorted set.
 
         Args:
             key: The sorted set key
             member: The member to get the score for
+            txn: Transaction to read in, e.g. from ``read_batch()``; a new read
+                transaction is used when omitted
 
         Returns:
             float: The score, or None if member doesn't exist
 
         Raises:
             LMDBOperationError: If the operation fails
+            ValueError: If a member is None with the json serializer
 
         Example:
             >>> client.zscore("leaderboard", "player1")
             100.0
         """
         try:
-            zset_key = self._format_key(key)
-            encoded_value = encode_value(member)
+            if txn is None:
+                with self.env.begin(db=self.zset_db, write=False) as txn:
+                    return self._zscore(txn, key, member)
+            return self._zscore(txn, key, member)
 
-            with self.env.begin(db=self.zset_db, write=False) as txn:
-                cursor = txn.cursor()
-                if cursor.set_range(zset_key):
-                    for compound_key, stored_value in cursor:
-                        if not compound_key.startswith(zset_key + self.SCORE_SEPARATOR):
-                            break
+        except lmdb.Error as e:
+            raise LMDBOperationError(f"Failed to get score: {e}") from e
+
+    def _zscore(
+        self, txn: lmdb.Transaction, key: Union[str, bytes], member: Any
+    ) -> Optional[float]:
+        """Get the score of a member inside an existing transaction."""
+        encoded_value = self._encode_value(member)
+        if encoded_value is None:
+            raise ValueError(_NONE_MEMBER)
+        member_key = self._member_key(self._format_key(key), encoded_value)
+        score_bytes = txn.get(member_key, db=self.member_db)
+        return decode_score_orderable(score_bytes) if score_bytes is not None else None
+
+    def zmscore(
+        self, key: Union[str, bytes], *members: Any, txn: Optional[lmdb.Transaction] = None
+    ) -> List[Optional[float]]:
+        """
+        Get the scores of several members of a sorted set.
 
-                        if stored_value == encoded_value:
-                            _, score = self._extract_from_zset_key(compound_key)
-                            return score
+        The member index is probed in key order with a single cursor, which
+        keeps consecutive lookups on neighbouring pages.
 
-            return None
+        Args:
+            key: The sorted set key
+            *members: One or more members to get the scores for
+            txn: Transaction to read in, e.g. from ``read_batch()``; a new read
+                transaction is used when omitted
+
+        Returns:
+            list: The score of each member in argument order, None for members
+            that don't exist
+
+        Raises:
+            LMDBOperationError: If the operation fails
+            ValueError: If a member is None with the json serializer
+
+        Example:
+            >>> client.zmscore("leaderboard", "player1", "nobody", "player2")
+            [100.0, None, 200.0]
+        """
+        try:
+            if txn is None:
+                with self.env.begin(db=self.zset_db, write=False) as txn:
+                    return self._zmscore(txn, key, *members)
+            return self._zmscore(txn, key, *members)
 
         except lmdb.Error as e:
-            raise LMDBOperationError(f"Failed to get score: {e}") from e
+            raise LMDBOperationError(f"Failed to get scores: {e}") from e
+
+    def _zmscore(
+        self, txn: lmdb.Transaction, key: Union[str, bytes], *members: Any
+    ) -> List[Optional[float]]:
+        """Get the scores of several members inside an existing transaction."""
+        member_prefix = self._format_key(key) + self.MEMBER_SEPARATOR
+        encoded = [self._encode_value(member) for member in members]
+        unique = set(encoded)
+        if None in unique:
+            raise ValueError(_NONE_MEMBER)
+
+        scores: Dict[bytes, float] = {}
+        cursor = txn.cursor(db=self.member_db)
+        for encoded_value in sorted(unique):
+            if cursor.set_key(member_prefix + encoded_value):
+                scores[encoded_value] = decode_score_orderable(cursor.value())
+
+        return [scores.get(encoded_value) for encoded_value in encoded]
+
+    def zrank(
+        self, key: Union[str, bytes], member: Any, *, txn: Optional[lmdb.Transaction] = None
+    ) -> Optional[int]:
+        """
+        Get the 0-based rank of a member in a sorted set, ordered by ascending score.
+
+        Args:
+            key: The sorted set key
+            member: The member to get the rank for
+            txn: Transaction to read in, e.g. from ``read_batch()``; a new read
+                transaction is used when omitted
+
+        Returns:
+            int: The rank, or None if member doesn't exist
+
+        Raises:
+            LMDBOperationError: If the operation fails
+            ValueError: If a member is None with the json serializer
+
+        Example:
+            >>> client.zrank("leaderboard", "player1")
+            0
+        """
+        try:
+            if txn is None:
+                with self.env.begin(db=self.zset_db, write=False) as txn:
+                    return self._zrank(txn, key, member)
+            return self._zrank(txn, key, member)
+
+        except lmdb.Error as e:
+            raise LMDBOperationError(f"Failed to get rank: {e}") from e
+
+    def _zrank(self, txn: lmdb.Transaction, key: Union[str, bytes], member: Any) -> Optional[int]:
+        """Get the rank of a member inside an existing transaction."""
+        zset_key = self._format_key(key)
+        encoded_value = self._encode_value(member)
+        if encoded_value is None:
+            raise ValueError(_NONE_MEMBER)
+
+        score_bytes = txn.get(self._member_key(zset_key, encoded_value), db=self.member_db)
+        if score_bytes is None:
+            return None
+
+        # The rank is the number of entries sorting before the member's own key
+        prefix = zset_key + self.SCORE_SEPARATOR
+        target = prefix + score_bytes + encoded_value
+        cursor = txn.cursor(db=self.zset_db)
+        cursor.set_range(prefix)
+        for rank, compound_key in enumerate(cursor.iternext(values=False)):
+            if compound_key == target:
+                return rank
+
+        return None
 
     def zcount(
         self,
         key: Union[str, bytes],
         min_score: Union[int, float],
         max_score: Union[int, float],
+        *,
+        txn: Optional[lmdb.Transaction] = None,
     ) -> int:
         """
         Count members in a sorted set with scores within the given range.
@@ -457,6 +1350,8 @@ class LMDBSortedSet:
             key: The sorted set key
             min_score: Minimum score (inclusive)
             max_score: Maximum score (inclusive)
+            txn: Transaction to read in, e.g. from ``read_batch()``; a new read
+                transaction is used when omitted
 
         Returns:
             int: Number of members in the score range
@@ -469,27 +1364,36 @@ class LMDBSortedSet:
             3
         """
         try:
-            count = 0
-            zset_key = self._format_key(key)
-            min_compound = self._zset_key(key, min_score)
+            if txn is None:
+                with self.env.begin(db=self.zset_db, write=False) as txn:
+                    return self._zcount(txn, key, min_score, max_score)
+            return self._zcount(txn, key, min_score, max_score)
 
-            with self.env.begin(db=self.zset_db, write=False) as txn:
-                cursor = txn.cursor()
-                if cursor.set_range(min_compound):
-                    for compound_key, _ in cursor:
-                        if not compound_key.startswith(zset_key + self.SCORE_SEPARATOR):
-                            break
+        except lmdb.Error as e:
+            raise LMDBOperationError(f"Failed to count members: {e}") from e
 
-                        _, score = self._extract_from_zset_key(compound_key)
-                        if score > max_score:
-                            break
+    def _zcount(
+        self,
+        txn: lmdb.Transaction,
+        key: Union[str, bytes],
+        min_score: Union[int, float],
+        max_score: Union[int, float],
+    ) -> int:
+        """Count members by score range inside an existing transaction."""
+        count = 0
+        prefix = self._format_key(key) + self.SCORE_SEPARATOR
+        min_compound = prefix + encode_score_orderable(min_score)
+        stop_key = self._upper_bound(prefix + encode_score_orderable(max_score))
 
-                        count += 1
+        cursor = txn.cursor(db=self.zset_db)
+        if cursor.set_range(min_compound):
+            for compound_key in cursor.iternext(values=False):
+                if compound_key >= stop_key:
+                    break
 
-            return count
+                count += 1
 
-        except lmdb.Error as e:
-            raise LMDBOperationError(f"Failed to count members: {e}") from e
+        return count
 
     def zremrangebyscore(
         self,
@@ -516,34 +1420,42 @@ class LMDBSortedSet:
             2
         """
         try:
-            zset_key = self._format_key(key)
-            min_compound = self._zset_key(key, min_score)
-            keys_to_delete = []
-
-            # First pass: collect keys to delete
-            with self.env.begin(db=self.zset_db, write=False) as txn:
-                cursor = txn.cursor()
-                if cursor.set_range(min_compound):
-                    for compound_key, _ in cursor:
-                        if not compound_key.startswith(zset_key + self.SCORE_SEPARATOR):
-                            break
-
-                        _, score = self._extract_from_zset_key(compound_key)
-                        if score > max_score:
-                            break
-
-                        keys_to_delete.append(compound_key)
-
-            # Second pass: delete the keys
-            with self.env.begin(db=self.zset_db, write=True) as txn:
-                for compound_key in keys_to_delete:
-                    txn.delete(compound_key)
-
-            return len(keys_to_delete)
+            with self._begin_write() as txn:
+                return self._zremrangebyscore(txn, key, min_score, max_score)
 
         except lmdb.Error as e:
             raise LMDBOperationError(f"Failed to remove range by score: {e}") from e
 
+    def _zremrangebyscore(
+        self,
+        txn: lmdb.Transaction,
+        key: Union[str, bytes],
+        min_score: Union[int, float],
+        max_score: Union[int, float],
+    ) -> int:
+        """Remove members by score range inside an existing write transaction."""
+        zset_key = self._format_key(key)
+        prefix = zset_key + self.SCORE_SEPARATOR
+        min_compound = prefix + encode_score_orderable(min_score)
+        stop_key = self._upper_bound(prefix + encode_score_orderable(max_score))
+        member_offset = len(prefix) + 8
+        removed = 0
+
+        # Delete in place: cursor.delete() advances to the next entry, and
+        # key() is empty once the cursor runs off the end of the database.
+        # The encoded member is the key suffix, so values are never fetched.
+        cursor = txn.cursor(db=self.zset_db)
+        cursor.set_range(min_compound)
+        compound_key = cursor.key()
+        while compound_key and compound_key < stop_key:
+            txn.delete(self._member_key(zset_key, compound_key[member_offset:]), db=self.member_db)
+            cursor.delete()
+            removed += 1
+            compound_key = cursor.key()
+
+        self._bump_count(txn, zset_key, -removed)
+        return removed
+
     def zpopmin(self, key: Union[str, bytes], count: int = 1) -> List[Tuple[Any, float]]:
         """
         Remove and return up to count members with the lowest scores.
@@ -563,37 +1475,37 @@ class LMDBSortedSet:
             [('player3', 50.0), ('player1', 100.0)]
         """
         try:
-            results = []
-            keys_to_delete = []
-            zset_key = self._format_key(key)
-
-            # First pass: collect items to pop
-            with self.env.begin(db=self.zset_db, write=False) as txn:
-                cursor = txn.cursor()
-                if cursor.set_range(zset_key):
-                    popped = 0
-                    for compound_key, value in cursor:
-                        if popped >= count:
-                            break
-
-                        if not compound_key.startswith(zset_key + self.SCORE_SEPARATOR):
-                            break
-
-                        _, score = self._extract_from_zset_key(compound_key)
-                        results.append((decode_value(value), score))
-                        keys_to_delete.append(compound_key)
-                        popped += 1
-
-            # Second pass: delete the keys
-            with self.env.begin(db=self.zset_db, write=True) as txn:
-                for compound_key in keys_to_delete:
-                    txn.delete(compound_key)
-
-            return results
+            with self._begin_write() as txn:
+                return self._zpopmin(txn, key, count)
 
         except lmdb.Error as e:
             raise LMDBOperationError(f"Failed to pop min: {e}") from e
 
+    def _zpopmin(
+        self, txn: lmdb.Transaction, key: Union[str, bytes], count: int = 1
+    ) -> List[Tuple[Any, float]]:
+        """Pop the lowest-scored members inside an existing write transaction."""
+        results = []
+        zset_key = self._format_key(key)
+        prefix = zset_key + self.SCORE_SEPARATOR
+        prefix_len = len(prefix)
+        stop_key = self._upper_bound(prefix)
+
+        # Pop in place: cursor.delete() advances to the next-lowest entry
+        cursor = txn.cursor(db=self.zset_db)
+        cursor.set_range(prefix)
+        compound_key = cursor.key()
+        while len(results) < count and compound_key and compound_key < stop_key:
+            value = cursor.value()
+            score = decode_score_orderable(compound_key[prefix_len : prefix_len + 8])
+            results.append((self._decode_value(value), score))
+            txn.delete(self._member_key(zset_key, value), db=self.member_db)
+            cursor.delete()
+            compound_key = cursor.key()
+
+        self._bump_count(txn, zset_key, -len(results))
+        return results
+
     def zpopmax(self, key: Union[str, bytes], count: int = 1) -> List[Tuple[Any, float]]:
         """
         Remove and return up to count members with the highest scores.
@@ -613,24 +1525,132 @@ class LMDBSortedSet:
             [('player2', 200.0), ('player1', 100.0)]
         """
         try:
-            # Get all items, then remove from the end
-            items = self.zrange(key, 0, -1, withscores=True)
+            with self._begin_write() as txn:
+                return self._zpopmax(txn, key, count)
+
+        except lmdb.Error as e:
+            raise LMDBOperationError(f"Failed to pop max: {e}") from e
+
+    def _zpopmax(
+        self, txn: lmdb.Transaction, key: Union[str, bytes], count: int = 1
+    ) -> List[Tuple[Any, float]]:
+        """Pop the highest-scored members inside an existing write transaction."""
+        results = []
+        zset_key = self._format_key(key)
+        prefix = zset_key + self.SCORE_SEPARATOR
+        prefix_len = len(prefix)
+
+        cursor = txn.cursor(db=self.zset_db)
+        if count <= 0 or not self._seek_last(cursor, prefix):
+            return results
+
+        # cursor.delete() moves forward, so step back first and then delete the
+        # entry that was just read
+        while len(results) < count:
+            compound_key, value = cursor.item()
+            score = decode_score_orderable(compound_key[prefix_len : prefix_len + 8])
+            results.append((self._decode_value(value), score))
+            has_prev = cursor.prev()
+            txn.delete(compound_key, db=self.zset_db)
+            txn.delete(self._member_key(zset_key, value), db=self.member_db)
+            if not has_prev or cursor.key() < prefix:
+                break
+
+        self._bump_count(txn, zset_key, -len(results))
+        return results
+
+    def zpeekmin(
+        self, key: Union[str, bytes], count: int = 1, *, txn: Optional[lmdb.Transaction] = None
+    ) -> List[Tuple[Any, float]]:
+        """
+        Return up to count members with the lowest scores without removing them.
 
-            if not items:
-                return []
+        Args:
+            key: The sorted set key
+            count: Number of members to return (default: 1)
+            txn: Transaction to read in, e.g. from ``read_batch()``; a new read
+                transaction is used when omitted
 
-            # Take the last 'count' items
-            to_remove = items[-count:] if count < len(items) else items
-            to_remove.reverse()  # Highest score first
+        Returns:
+            list: List of (member, score) tuples in ascending order
 
-            # Remove them
-            members = [item[0] for item in to_remove]
-            self.zrem(key, *members)
+        Raises:
+            LMDBOperationError: If the operation fails
 
-            return to_remove
+        Example:
+            >>> client.zpeekmin("leaderboard", 2)
+            [('player3', 50.0), ('player1', 100.0)]
+        """
+        try:
+            if txn is None:
+                with self.env.begin(db=self.zset_db, write=False) as txn:
+                    return self._zpeekmin(txn, key, count)
+            return self._zpeekmin(txn, key, count)
 
         except lmdb.Error as e:
-            raise LMDBOperationError(f"Failed to pop max: {e}") from e
+            raise LMDBOperationError(f"Failed to peek min: {e}") from e
+
+    def _zpeekmin(
+        self, txn: lmdb.Transaction, key: Union[str, bytes], count: int = 1
+    ) -> List[Tuple[Any, float]]:
+        """Read the lowest-scored members inside an existing transaction."""
+        zset_key = self._format_key(key)
+        prefix = zset_key + self.SCORE_SEPARATOR
+        limit = min(count, self._count(txn, zset_key))
+        if limit <= 0:
+            return []
+
+        cursor = txn.cursor(db=self.zset_db)
+        cursor.set_range(prefix)
+        return self._take(cursor.iternext(), limit, len(prefix), withscores=True)
+
+    def zpeekmax(
+        self, key: Union[str, bytes], count: int = 1, *, txn: Optional[lmdb.Transaction] = None
+    ) -> List[Tuple[Any, float]]:
+        """
+        Return up to count members with the highest scores without removing them.
+
+        Runs in a read-only transaction, so unlike ``zpopmax`` followed by a
+        ``zadd`` to put members back, it never takes the write lock.
+
+        Args:
+            key: The sorted set key
+            count: Number of members to return (default: 1)
+            txn: Transaction to read in, e.g. from ``read_batch()``; a new read
+                transaction is used when omitted
+
+        Returns:
+            list: List of (member, score) tuples in descending order
+
+        Raises:
+            LMDBOperationError: If the operation fails
+
+        Example:
+            >>> client.zpeekmax("leaderboard", 2)
+            [('player2', 200.0), ('player1', 100.0)]
+        """
+        try:
+            if txn is None:
+                with self.env.begin(db=self.zset_db, write=False) as txn:
+                    return self._zpeekmax(txn, key, count)
+            return self._zpeekmax(txn, key, count)
+
+        except lmdb.Error as e:
+            raise LMDBOperationError(f"Failed to peek max: {e}") from e
+
+    def _zpeekmax(
+        self, txn: lmdb.Transaction, key: Union[str, bytes], count: int = 1
+    ) -> List[Tuple[Any, float]]:
+        """Read the highest-scored members inside an existing transaction."""
+        zset_key = self._format_key(key)
+        prefix = zset_key + self.SCORE_SEPARATOR
+        limit = min(count, self._count(txn, zset_key))
+        if limit <= 0:
+            return []
+
+        cursor = txn.cursor(db=self.zset_db)
+        self._seek_last(cursor, prefix)
+        return self._take(cursor.iterprev(), limit, len(prefix), withscores=True)
 
     def delete(self, key: Union[str, bytes]) -> bool:
         """
@@ -650,37 +1670,142 @@ class LMDBSortedSet:
             True
         """
         try:
-            zset_key = self._format_key(key)
-            keys_to_delete = []
+            with self._begin_write() as txn:
+                return self._delete(txn, key)
 
-            # First pass: collect all keys in this sorted set
-            with self.env.begin(db=self.zset_db, write=False) as txn:
-                cursor = txn.cursor()
-                if cursor.set_range(zset_key):
-                    for compound_key, _ in cursor:
-                        if not compound_key.startswith(zset_key + self.SCORE_SEPARATOR):
-                            break
-                        keys_to_delete.append(compound_key)
-
-            # Second pass: delete all the keys
-            if keys_to_delete:
-                with self.env.begin(db=self.zset_db, write=True) as txn:
-                    for compound_key in keys_to_delete:
-                        txn.delete(compound_key)
-                return True
+        except lmdb.Error as e:
+            raise LMDBOperationError(f"Failed to delete sorted set: {e}") from e
 
-            return False
+    def _delete(self, txn: lmdb.Transaction, key: Union[str, bytes]) -> bool:
+        """Delete an entire sorted set inside an existing write transaction."""
+        zset_key = self._format_key(key)
+        prefix = zset_key + self.SCORE_SEPARATOR
+        stop_key = self._upper_bound(prefix)
+        member_offset = len(prefix) + 8
+        deleted = False
+
+        # Delete in place: cursor.delete() advances to the next entry, and the
+        # member index key is rebuilt from the key suffix rather than the value
+        cursor = txn.cursor(db=self.zset_db)
+        cursor.set_range(prefix)
+        compound_key = cursor.key()
+        while compound_key and compound_key < stop_key:
+            txn.delete(self._member_key(zset_key, compound_key[member_offset:]), db=self.member_db)
+            cursor.delete()
+            deleted = True
+            compound_key = cursor.key()
+
+        txn.delete(zset_key, db=self.count_db)
+        return deleted
+
+    def pipeline(self) -> "Pipeline":
+        """
+        Create a pipeline that runs several commands in one write transaction.
+
+        Commands queued on the pipeline are not executed until ``execute()`` is
+        called or the ``with`` block exits, so a batch of writes pays for a
+        single LMDB commit instead of one commit per command.
+
+        Returns:
+            Pipeline: A new pipeline bound to this client
 
+        Example:
+            >>> with client.pipeline() as pipe:
+            >>>     pipe.zadd("requests", {"req1": 100})
+            >>>     pipe.zremrangebyscore("requests", 0, 40)
+            >>>     pipe.zcard("requests")
+            >>>     added, removed, count = pipe.execute()
+        """
+        return Pipeline(self)
+
+    @contextmanager
+    def read_batch(self) -> Iterator[lmdb.Transaction]:
+        """
+        Open one read transaction for a batch of read calls.
+
+        Pass the yielded transaction as ``txn=`` to the read methods (zrange,
+        zrangebyscore, zcard, zscore, zmscore, zrank, zcount, zpeekmin, zpeekmax) so
+        they share a single consistent snapshot instead of each beginning and
+        ending its own transaction.
+
+        Yields:
+            lmdb.Transaction: A read-only transaction on this client's environment
+
+        Raises:
+            LMDBOperationError: If the transaction cannot be started
+
+        Example:
+            >>> with client.read_batch() as txn:
+            >>>     sizes = [client.zcard(key, txn=txn) for key in keys]
+        """
+        try:
+            txn = self.env.begin(db=self.zset_db, write=False)
         except lmdb.Error as e:
-            raise LMDBOperationError(f"Failed to delete sorted set: {e}") from e
+            raise LMDBOperationError(f"Failed to begin read batch: {e}") from e
+
+        try:
+            yield txn
+        finally:
+            txn.abort()
+
+    def sync(self, force: bool = True):
+        """
+        Flush committed data to disk.
+
+        Only needed when the environment was opened with ``sync=False``,
+        ``metasync=False`` or ``map_async=True``; otherwise every commit is
+        already durable.
+
+        Args:
+            force: Flush synchronously even if the environment was opened with
+                ``sync=False`` (default: True)
+
+        Raises:
+            LMDBOperationError: If the flush fails
+
+        Example:
+            >>> client.zadd("leaderboard", {"player1": 100})
+            >>> client.sync()
+        """
+        try:
+            self.env.sync(force)
+
+        except lmdb.Error as e:
+            raise LMDBOperationError(f"Failed to sync environment: {e}") from e
 
     def close(self):
         """
         Close the LMDB environment and release resources.
 
         This method should be called when the client is no longer needed
-        to ensure proper cleanup of LMDB resources.
+        to ensure proper cleanup of LMDB resources. The environment itself is
+        closed once every client sharing it has been closed.
         """
         if self.env:
-            self.env.close()
-            logger.info(f"LMDB SortedSet closed: {self.path}")
+            env, self.env = self.env, None
+            self.zset_db = None
+            self.count_db = None
+            self.member_db = None
+            _release_environment(self._env_key, env)
+            logger.debug(f"LMDB SortedSet closed: {self.path}")
+
+
+def _forget_environments_after_fork() -> None:
+    """
+    Close environments inherited from the parent in a forked child.
+
+    LMDB forbids using an environment after fork(), and lmdb-py refuses to
+    reopen a path it still considers open, so the child closes its copies
+    (the parent's reader slots and locks are untouched) and starts with an
+    empty registry. Clients inherited from the parent stop working.
+    """
+    global _environments_lock
+    _environments_lock = threading.RLock()
+    for env, _ in _environments.values():
+        env.close()
+    _environments.clear()
+    LMDBSortedSet._shared_clients.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_environments_after_fork)
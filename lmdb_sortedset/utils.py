@@ -2,9 +2,29 @@
 Utility functions for encoding/decoding data in LMDB SortedSet.
 """
 
+import functools
 import json
 import struct
-from typing import Any, Optional, Union
+from typing import Any, Iterable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+
+# Precompiled formats, so packing a score skips the struct format cache lookup
+_DOUBLE = struct.Struct(">d")
+_UINT64 = struct.Struct(">Q")
+
+# Bit masks used to make IEEE-754 doubles sort correctly as unsigned bytes
+_SIGN_BIT = 1 << 63
+_ALL_BITS = (1 << 64) - 1
 
 
 def encode_value(value: Any) -> Optional[bytes]:
@@ -28,17 +48,51 @@ def encode_value(value: Any) -> Optional[bytes]:
         >>> encode_value({"key": "value"})
         b'{"key": "value"}'
     """
-    if value is None:
-        return None
+    encoder = _ENCODERS.get(type(value))
+    if encoder is not None:
+        return encoder(value)
+    return _encode_other(value)
+
+
+def _encode_number(value: Union[int, float]) -> bytes:
+    """Encode an int or float as its decimal text."""
+    return str(value).encode("utf-8")
+
+
+def _is_numpy_scalar(value: Any) -> bool:
+    """Return whether a value is a NumPy scalar (or 0-d array), without importing NumPy."""
+    return getattr(value, "shape", None) == () and hasattr(value, "item")
+
+
+def _encode_other(value: Any) -> bytes:
+    """Encode subclasses of the built-in types, NumPy scalars and structured values."""
     if isinstance(value, bytes):
         return value
     if isinstance(value, (int, float)):
-        return str(value).encode("utf-8")
+        return _encode_number(value)
     if isinstance(value, str):
         return value.encode("utf-8")
+    # Elements of NumPy arrays (e.g. numpy.int64) are not int subclasses;
+    # unwrap them so they encode like the Python value they hold
+    if _is_numpy_scalar(value):
+        return encode_value(value.item())
+    # Encoded values are member identities, so this stays on the stdlib encoder:
+    # orjson's output differs (e.g. no spaces), which would orphan stored members
     return json.dumps(value).encode("utf-8")
 
 
+# Exact-type dispatch for encode_value; one dict lookup replaces a chain of
+# isinstance checks for the common member types
+_ENCODERS = {
+    str: str.encode,
+    bytes: lambda value: value,
+    int: _encode_number,
+    float: _encode_number,
+    bool: _encode_number,
+    type(None): lambda value: None,
+}
+
+
 def decode_value(value: Optional[bytes], as_json: bool = False) -> Optional[Union[str, dict, list]]:
     """
     Decode a value from LMDB storage.
@@ -61,6 +115,81 @@ def decode_value(value: Optional[bytes], as_json: bool = False) -> Optional[Unio
     return value.decode("utf-8")
 
 
+# Serializers accepted by encode_value_tagged, mapped to their module (None
+# when the optional package is not installed)
+TAGGED_SERIALIZERS = {"orjson": orjson, "msgpack": msgpack}
+
+
+def encode_value_tagged(value: Any, serializer: str = "msgpack") -> bytes:
+    """
+    Encode a value behind a one-byte type tag so it decodes to its original type.
+
+    Unlike ``encode_value``, structured values are serialized with a C
+    implementation, and ``decode_value_tagged`` needs no hint about the
+    type. Tags: ``S`` str, ``B`` bytes, ``I`` int, ``F`` float, ``J`` orjson,
+    ``M`` msgpack. The encoding of a structured value depends on the
+    serializer, so a database must always be written with the same one.
+
+    Args:
+        value: The value to encode
+        serializer: "orjson" or "msgpack", used for values that are not
+            str, bytes, int or float
+
+    Returns:
+        bytes: The tagged encoding
+
+    Example:
+        >>> encode_value_tagged(42)
+        b'I42'
+    """
+    if isinstance(value, str):
+        return b"S" + value.encode("utf-8")
+    if isinstance(value, bytes):
+        return b"B" + value
+    # bool is an int subclass; let it round-trip through the serializer
+    if type(value) is int:
+        return b"I" + str(value).encode("utf-8")
+    if type(value) is float:
+        return b"F" + repr(value).encode("utf-8")
+    if _is_numpy_scalar(value):
+        return encode_value_tagged(value.item(), serializer)
+    if serializer == "msgpack":
+        return b"M" + msgpack.packb(value)
+    return b"J" + orjson.dumps(value)
+
+
+def decode_value_tagged(value: Optional[bytes]) -> Any:
+    """
+    Decode a value written by ``encode_value_tagged``.
+
+    Args:
+        value: The tagged bytes value from LMDB
+
+    Returns:
+        The decoded value, with its original type
+
+    Example:
+        >>> decode_value_tagged(b'J{"key":"value"}')
+        {'key': 'value'}
+    """
+    if value is None:
+        return None
+    tag, payload = value[:1], value[1:]
+    if tag == b"S":
+        return payload.decode("utf-8")
+    if tag == b"B":
+        return payload
+    if tag == b"I":
+        return int(payload)
+    if tag == b"F":
+        return float(payload)
+    if tag == b"M":
+        return msgpack.unpackb(payload)
+    if tag == b"J":
+        return orjson.loads(payload)
+    raise ValueError(f"Unknown value tag: {tag!r}")
+
+
 def encode_score(score: Union[int, float]) -> bytes:
     """
     Encode a numerical score for sorted set storage.
@@ -78,7 +207,7 @@ def encode_score(score: Union[int, float]) -> bytes:
         >>> encode_score(123.45)
         b'@^\\xcc\\xcc\\xcc\\xcc\\xcc\\xcd'
     """
-    return struct.pack(">d", float(score))
+    return _DOUBLE.pack(float(score))
 
 
 def decode_score(score_bytes: bytes) -> float:
@@ -95,7 +224,91 @@ def decode_score(score_bytes: bytes) -> float:
         >>> decode_score(b'@^\\xcc\\xcc\\xcc\\xcc\\xcc\\xcd')
         123.45
     """
-    return struct.unpack(">d", score_bytes)[0]
+    return _DOUBLE.unpack(score_bytes)[0]
+
+
+def encode_score_orderable(score: Union[int, float]) -> bytes:
+    """
+    Encode a score so that byte order matches numeric order.
+
+    Plain big-endian doubles only sort correctly as bytes for non-negative
+    values. Setting the sign bit of non-negative scores and inverting every
+    bit of negative ones makes lexicographic order equal numeric order across
+    the whole double range, so LMDB keys built from these bytes iterate in
+    score order and range scans can compare raw keys. ``-0.0`` is stored as
+    ``0.0``. Integer scores, common in leaderboards and for timestamps, are
+    served from a bounded cache.
+
+    Args:
+        score: The score value (int or float)
+
+    Returns:
+        bytes: 8-byte order-preserving representation
+
+    Example:
+        >>> encode_score_orderable(-1) < encode_score_orderable(0) < encode_score_orderable(1)
+        True
+    """
+    if type(score) is int:
+        return _encode_int_score(score)
+    return _encode_orderable(float(score))
+
+
+@functools.lru_cache(maxsize=4096)
+def _encode_int_score(score: int) -> bytes:
+    """Encode an integer score, memoizing recently used values."""
+    return _encode_orderable(float(score))
+
+
+def _encode_orderable(score: float) -> bytes:
+    """Encode a float score with the order-preserving bit transform."""
+    (bits,) = _UINT64.unpack(_DOUBLE.pack(score + 0.0))
+    return _UINT64.pack(bits ^ (_ALL_BITS if bits & _SIGN_BIT else _SIGN_BIT))
+
+
+def encode_scores_orderable(scores: Iterable[Union[int, float]]) -> bytes:
+    """
+    Encode many scores into one contiguous buffer of order-preserving bytes.
+
+    Produces the same bytes as calling ``encode_score_orderable`` per score,
+    but packs and unpacks every score with a single ``struct`` call each.
+    Score ``i`` occupies bytes ``i * 8`` to ``i * 8 + 8``.
+
+    Args:
+        scores: The score values (int or float)
+
+    Returns:
+        bytes: 8 bytes per score, in input order
+
+    Example:
+        >>> encode_scores_orderable([1, 2.5])
+        b'\\xbf\\xf0\\x00\\x00\\x00\\x00\\x00\\x00\\xc0\\x04\\x00\\x00\\x00\\x00\\x00\\x00'
+    """
+    scores = [float(score) + 0.0 for score in scores]
+    count = len(scores)
+    words = struct.unpack(f">{count}Q", struct.pack(f">{count}d", *scores))
+    return struct.pack(
+        f">{count}Q",
+        *[word ^ (_ALL_BITS if word & _SIGN_BIT else _SIGN_BIT) for word in words],
+    )
+
+
+def decode_score_orderable(score_bytes: bytes) -> float:
+    """
+    Decode a score written by ``encode_score_orderable``.
+
+    Args:
+        score_bytes: 8-byte order-preserving representation
+
+    Returns:
+        float: The decoded score value
+
+    Example:
+        >>> decode_score_orderable(encode_score_orderable(-123.45))
+        -123.45
+    """
+    (bits,) = _UINT64.unpack(score_bytes)
+    return _DOUBLE.unpack(_UINT64.pack(bits ^ (_SIGN_BIT if bits & _SIGN_BIT else _ALL_BITS)))[0]
 
 
 def format_key(key: Union[str, bytes], prefix: str = "") -> bytes:
@@ -113,9 +326,7 @@ def format_key(key: Union[str, bytes], prefix: str = "") -> bytes:
         >>> format_key("mykey", "app")
         b'app:mykey'
     """
-    if isinstance(key, bytes):
-        key = key.decode("utf-8")
-
+    key_bytes = key if isinstance(key, bytes) else key.encode("utf-8")
     if prefix:
-        return f"{prefix}:{key}".encode("utf-8")
-    return key.encode("utf-8")
+        return prefix.encode("utf-8") + b":" + key_bytes
+    return key_bytes
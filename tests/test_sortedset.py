@@ -2,31 +2,72 @@
 Unit tests for LMDB SortedSet library.
 """
 
+import json
+import lmdb
+import os
 import pytest
+import subprocess
+import sys
 import tempfile
 import shutil
+import uuid
 from pathlib import Path
 
 from lmdb_sortedset import LMDBSortedSet, LMDBInitError, LMDBOperationError
+from lmdb_sortedset.utils import decode_value, encode_score, encode_value
+
+# Keep the shared session database in RAM when tmpfs is available
+TEMP_ROOT = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# Flags of the shared session environment; clients joining it must match them
+SESSION_FLAGS = {"writemap": True, "metasync": False, "sync": False}
+
+# Shared member/score fixtures; zadd never mutates its input
+THREE = {"a": 1, "b": 2, "c": 3}
+FIVE = {"a": 1, "b": 2, "c": 3, "d": 4, "e": 5}
 
 
 @pytest.fixture
-def temp_db_path():
-    """Create a temporary directory for testing."""
-    temp_dir = tempfile.mkdtemp()
+def temp_db_path(tmp_path):
+    """Create a temporary directory for testing, cleaned up by pytest."""
+    return str(tmp_path)
+
+
+@pytest.fixture(scope="session")
+def session_db_path():
+    """Create one temporary directory per test process (one per xdist worker)."""
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    temp_dir = tempfile.mkdtemp(prefix=f"lmdb-{worker_id}-", dir=TEMP_ROOT)
     yield temp_dir
     # Cleanup
     shutil.rmtree(temp_dir, ignore_errors=True)
 
 
+@pytest.fixture(scope="session")
+def session_client(session_db_path):
+    """Open the LMDB environment once, without commit flushing, for the session."""
+    client = LMDBSortedSet(path=session_db_path, **SESSION_FLAGS)
+    yield client
+    client.close()
+
+
 @pytest.fixture
-def sortedset_client(temp_db_path):
-    """Create a LMDBSortedSet client for testing."""
-    client = LMDBSortedSet(path=temp_db_path)
+def sortedset_client(session_client, session_db_path):
+    """Create a LMDBSortedSet client isolated by a unique key prefix."""
+    client = LMDBSortedSet(
+        path=session_db_path, key_prefix=f"test_{uuid.uuid4().hex[:8]}", **SESSION_FLAGS
+    )
     yield client
     client.close()
 
 
+@pytest.fixture
+def populated_test_set(sortedset_client):
+    """Create a client whose "test" set holds members a-d scored 1-4."""
+    sortedset_client.zadd("test", {"a": 1, "b": 2, "c": 3, "d": 4})
+    return sortedset_client
+
+
 class TestLMDBSortedSetInit:
     """Test initialization and context manager."""
 
@@ -51,19 +92,130 @@ class TestLMDBSortedSetInit:
             client.zadd("test", {"member1": 1.0})
             assert client.zcard("test") == 1
 
+    def test_environment_flags(self, temp_db_path):
+        """Test that environment tuning flags are passed to LMDB."""
+        with LMDBSortedSet(
+            path=temp_db_path, writemap=True, metasync=False, readahead=False
+        ) as client:
+            flags = client.env.flags()
+            assert flags["writemap"] is True
+            assert flags["metasync"] is False
+            assert flags["readahead"] is False
+
+            client.zadd("test", {"a": 1})
+            assert client.zrange("test", 0, -1) == ["a"]
+
+    def test_sync_flags(self, temp_db_path):
+        """Test that commit flushing can be relaxed."""
+        with LMDBSortedSet(path=temp_db_path, writemap=True, sync=False, map_async=True) as client:
+            flags = client.env.flags()
+            assert flags["sync"] is False
+            assert flags["map_async"] is True
+
+            client.zadd("test", {"a": 1})
+            assert client.zscore("test", "a") == 1.0
+
+
+class TestSharedEnvironment:
+    """Test environment sharing and named sub-databases."""
+
+    def test_clients_share_environment(self, temp_db_path):
+        """Test that clients on the same path reuse one environment."""
+        with LMDBSortedSet(path=temp_db_path) as first:
+            with LMDBSortedSet(path=temp_db_path) as second:
+                assert first.env is second.env
+                first.zadd("test", {"a": 1})
+                assert second.zrange("test", 0, -1) == ["a"]
+
+            # Closing one client leaves the shared environment usable
+            assert first.zcard("test") == 1
+
+    def test_db_name_isolation(self, temp_db_path):
+        """Test that sub-databases in one environment are independent."""
+        with LMDBSortedSet(path=temp_db_path, db_name="one") as one:
+            with LMDBSortedSet(path=temp_db_path, db_name="two") as two:
+                one.zadd("test", {"a": 1})
+                assert two.zcard("test") == 0
+
+    def test_shared_returns_same_client(self, temp_db_path):
+        """Test that shared() memoizes clients until close_shared()."""
+        try:
+            client = LMDBSortedSet.shared(temp_db_path, db_name="leaderboard")
+            assert LMDBSortedSet.shared(temp_db_path, db_name="leaderboard") is client
+            assert LMDBSortedSet.shared(temp_db_path, db_name="tasks") is not client
+        finally:
+            LMDBSortedSet.close_shared()
+
+        assert client.env is None
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_forked_child_opens_its_own_environment(self, temp_db_path):
+        """Test that a child process does not reuse the parent's environment."""
+        with LMDBSortedSet(path=temp_db_path) as parent:
+            parent.zadd("test", {"a": 1})
+            shared = LMDBSortedSet.shared(temp_db_path)
+            pid = os.fork()
+            if pid == 0:
+                status = 1
+                try:
+                    with LMDBSortedSet(path=temp_db_path) as child:
+                        if (
+                            child.env is not parent.env
+                            and LMDBSortedSet.shared(temp_db_path) is not shared
+                            and child.zrange("test", 0, -1) == ["a"]
+                        ):
+                            status = 0
+                finally:
+                    os._exit(status)
+
+            _, status = os.waitpid(pid, 0)
+            LMDBSortedSet.close_shared()
+            assert os.WEXITSTATUS(status) == 0
+            assert parent.zcard("test") == 1
+
+    def test_readonly_client_on_writable_environment(self, temp_db_path):
+        """Test that a read-only client sharing a writable environment cannot write."""
+        with LMDBSortedSet(path=temp_db_path) as writer:
+            writer.zadd("test", {"a": 1})
+            with LMDBSortedSet(path=temp_db_path, readonly=True) as reader:
+                assert reader.zrange("test", 0, -1) == ["a"]
+                with pytest.raises(LMDBOperationError):
+                    reader.zadd("test", {"b": 2})
+                with pytest.raises(LMDBOperationError):
+                    reader.pipeline().zrem("test", "a").execute()
+            assert writer.zrange("test", 0, -1) == ["a"]
+
+    def test_writable_client_on_readonly_environment(self, temp_db_path):
+        """Test that a writable client cannot join an environment opened read-only."""
+        LMDBSortedSet(path=temp_db_path).close()
+        with LMDBSortedSet(path=temp_db_path, readonly=True) as reader:
+            assert reader.env.flags()["readonly"] is True
+            with pytest.raises(LMDBInitError, match="read-only"):
+                LMDBSortedSet(path=temp_db_path)
+
+    def test_mismatched_flags_rejected(self, temp_db_path):
+        """Test that a client requesting different environment flags is rejected."""
+        with LMDBSortedSet(path=temp_db_path, sync=False):
+            with pytest.raises(LMDBInitError, match="sync"):
+                LMDBSortedSet(path=temp_db_path)
+
 
 class TestZAdd:
     """Test zadd operation."""
 
-    def test_zadd_single_member(self, sortedset_client):
-        """Test adding a single member."""
-        result = sortedset_client.zadd("test", {"member1": 100})
-        assert result == 1
-
-    def test_zadd_multiple_members(self, sortedset_client):
-        """Test adding multiple members."""
-        result = sortedset_client.zadd("test", {"member1": 100, "member2": 200, "member3": 150})
-        assert result == 3
+    @pytest.mark.parametrize(
+        "mapping,expected",
+        [
+            ({"member1": 100}, 1),
+            ({"member1": 100, "member2": 200, "member3": 150}, 3),
+            ({"string": 1.0, 123: 2.0, 45.67: 3.0}, 3),
+        ],
+        ids=["single", "multiple", "different_types"],
+    )
+    def test_zadd_new_members(self, sortedset_client, mapping, expected):
+        """Test adding new members of one or more types."""
+        assert sortedset_client.zadd("test", mapping) == expected
+        assert sortedset_client.zcard("test") == expected
 
     def test_zadd_updates_score(self, sortedset_client):
         """Test that zadd updates existing member's score."""
@@ -73,20 +225,160 @@ class TestZAdd:
         score = sortedset_client.zscore("test", "member1")
         assert score == 200.0
 
-    def test_zadd_different_types(self, sortedset_client):
-        """Test adding members of different types."""
-        result = sortedset_client.zadd("test", {"string": 1.0, 123: 2.0, 45.67: 3.0})
+    def test_zadd_mixed_batch(self, sortedset_client):
+        """Test one zadd that updates, keeps and inserts members together."""
+        sortedset_client.zadd("test", THREE)
+        result = sortedset_client.zadd("test", {"a": 10, "b": 2, "d": 4})
+        assert result == 3
+        assert sortedset_client.zrange("test", 0, -1, withscores=True) == [
+            ("b", 2.0),
+            ("c", 3.0),
+            ("d", 4.0),
+            ("a", 10.0),
+        ]
+
+    def test_zadd_same_score_is_noop(self, sortedset_client):
+        """Test that re-adding a member with its current score keeps one entry."""
+        sortedset_client.zadd("test", {"member1": 100, "member2": 200})
+        result = sortedset_client.zadd("test", {"member1": 100})
+        assert result == 1
+        assert sortedset_client.zrange("test", 0, -1, withscores=True) == [
+            ("member1", 100.0),
+            ("member2", 200.0),
+        ]
+
+    def test_zadd_members_sharing_a_score(self, sortedset_client):
+        """Test that members with equal scores are all kept."""
+        sortedset_client.zadd("test", {"a": 1, "b": 1, "c": 1})
+        assert sortedset_client.zcard("test") == 3
+        assert sortedset_client.zrange("test", 0, -1) == ["a", "b", "c"]
+
+
+class TestZAddMany:
+    """Test zadd_many operation."""
+
+    def test_zadd_many_sets(self, sortedset_client):
+        """Test adding members to several sets at once."""
+        result = sortedset_client.zadd_many({"s1": {"a": 1, "b": 2}, "s2": {"x": 10}})
+        assert result == 3
+        assert sortedset_client.zrange("s1", 0, -1) == ["a", "b"]
+        assert sortedset_client.zrange("s2", 0, -1, withscores=True) == [("x", 10.0)]
+
+    def test_zadd_many_updates_existing(self, sortedset_client):
+        """Test that zadd_many updates scores like zadd."""
+        sortedset_client.zadd("s1", {"a": 1, "b": 2})
+        sortedset_client.zadd_many({"s1": {"a": 5}, "s2": {}})
+        assert sortedset_client.zrange("s1", 0, -1, withscores=True) == [("b", 2.0), ("a", 5.0)]
+        assert sortedset_client.zcard("s1") == 2
+        assert sortedset_client.zcard("s2") == 0
+
+
+class TestZAddBulk:
+    """Test zadd_bulk operation."""
+
+    def test_zadd_bulk_basic(self, sortedset_client):
+        """Test bulk adding members from parallel sequences."""
+        result = sortedset_client.zadd_bulk("test", ["c", "a", "b"], [3, 1, 2])
+        assert result == 3
+        assert sortedset_client.zrange("test", 0, -1, withscores=True) == [
+            ("a", 1.0),
+            ("b", 2.0),
+            ("c", 3.0),
+        ]
+
+    def test_zadd_bulk_updates_existing(self, sortedset_client):
+        """Test that bulk adds replace existing members' scores."""
+        sortedset_client.zadd("test", {"a": 1, "b": 2})
+        sortedset_client.zadd_bulk("test", ["a", "c"], [5, 3])
+        assert sortedset_client.zrange("test", 0, -1) == ["b", "c", "a"]
+        assert sortedset_client.zcard("test") == 3
+
+    def test_zadd_bulk_before_existing_set(self, sortedset_client):
+        """Test bulk adding into a set that sorts before existing keys."""
+        sortedset_client.zadd("z", {"x": 1})
+        sortedset_client.zadd_bulk("a", ["m", "n"], [1, 2])
+        assert sortedset_client.zrange("a", 0, -1) == ["m", "n"]
+        assert sortedset_client.zrange("z", 0, -1) == ["x"]
+
+    def test_zadd_bulk_numpy_arrays(self, sortedset_client):
+        """Test that NumPy arrays work as members and scores."""
+        np = pytest.importorskip("numpy")
+        sortedset_client.zadd_bulk("test", np.array([30, 10, 20]), np.array([3.0, 1.0, 2.0]))
+        assert sortedset_client.zrange("test", 0, -1, withscores=True) == [
+            ("10", 1.0),
+            ("20", 2.0),
+            ("30", 3.0),
+        ]
+        assert sortedset_client.zscore("test", 20) == 2.0
+
+    def test_zadd_bulk_length_mismatch(self, sortedset_client):
+        """Test that mismatched sequences are rejected."""
+        with pytest.raises(ValueError):
+            sortedset_client.zadd_bulk("test", ["a", "b"], [1])
+
+
+class TestZAddSorted:
+    """Test zadd_sorted operation."""
+
+    def test_zadd_sorted_empty_set(self, sortedset_client):
+        """Test loading an empty set from score-ordered pairs."""
+        sortedset_client.zadd("z", {"x": 1})
+        result = sortedset_client.zadd_sorted("test", [("a", 1), ("b", 2), ("c", 3)])
         assert result == 3
+        assert sortedset_client.zrange("test", 0, -1) == ["a", "b", "c"]
+        assert sortedset_client.zrange("z", 0, -1) == ["x"]
+
+    def test_zadd_sorted_rejects_non_empty_set(self, sortedset_client):
+        """Test that loading into a non-empty set fails without writing."""
+        sortedset_client.zadd("test", {"a": 1})
+        with pytest.raises(LMDBOperationError):
+            sortedset_client.zadd_sorted("test", [("b", 2)])
+        assert sortedset_client.zrange("test", 0, -1) == ["a"]
+
+
+class TestZIncrBy:
+    """Test zincrby operation."""
+
+    def test_zincrby_existing_member(self, sortedset_client):
+        """Test incrementing the score of an existing member."""
+        sortedset_client.zadd("test", {"a": 1, "b": 2})
+        result = sortedset_client.zincrby("test", "a", 5)
+        assert result == 6.0
+        assert sortedset_client.zrange("test", 0, -1, withscores=True) == [("b", 2.0), ("a", 6.0)]
+
+    def test_zincrby_zero(self, sortedset_client):
+        """Test that a zero increment leaves the member unchanged."""
+        sortedset_client.zadd("test", {"a": 1})
+        assert sortedset_client.zincrby("test", "a", 0) == 1.0
+        assert sortedset_client.zrange("test", 0, -1, withscores=True) == [("a", 1.0)]
+
+    def test_zincrby_new_member(self, sortedset_client):
+        """Test that zincrby adds a missing member with the increment as score."""
+        result = sortedset_client.zincrby("test", "a", 2.5)
+        assert result == 2.5
+        assert sortedset_client.zcard("test") == 1
 
 
 class TestZRange:
     """Test zrange operation."""
 
-    def test_zrange_all(self, sortedset_client):
-        """Test getting all members."""
-        sortedset_client.zadd("test", {"a": 1, "b": 2, "c": 3})
-        result = sortedset_client.zrange("test", 0, -1)
-        assert result == ["a", "b", "c"]
+    @pytest.mark.parametrize(
+        "start,stop,expected",
+        [
+            (0, -1, ["a", "b", "c", "d", "e"]),
+            (1, 3, ["b", "c", "d"]),
+            (-3, -1, ["c", "d", "e"]),
+            (1, -2, ["b", "c", "d"]),
+            (-10, 0, ["a"]),
+            (0, -10, []),
+            (3, 10, ["d", "e"]),
+            (5, 10, []),
+        ],
+    )
+    def test_zrange_indices(self, sortedset_client, start, stop, expected):
+        """Test slicing by positive, negative and out-of-range indices."""
+        sortedset_client.zadd_many({"test": FIVE, "testz": {"x": 1}})
+        assert sortedset_client.zrange("test", start, stop) == expected
 
     def test_zrange_with_scores(self, sortedset_client):
         """Test getting members with scores."""
@@ -94,12 +386,6 @@ class TestZRange:
         result = sortedset_client.zrange("test", 0, -1, withscores=True)
         assert result == [("a", 1.0), ("b", 2.0), ("c", 3.0)]
 
-    def test_zrange_slice(self, sortedset_client):
-        """Test getting a slice of members."""
-        sortedset_client.zadd("test", {"a": 1, "b": 2, "c": 3, "d": 4, "e": 5})
-        result = sortedset_client.zrange("test", 1, 3)
-        assert result == ["b", "c", "d"]
-
     def test_zrange_empty_set(self, sortedset_client):
         """Test zrange on empty set."""
         result = sortedset_client.zrange("nonexistent", 0, -1)
@@ -111,7 +397,7 @@ class TestZRangeByScore:
 
     def test_zrangebyscore_basic(self, sortedset_client):
         """Test getting members by score range."""
-        sortedset_client.zadd("test", {"a": 1, "b": 2, "c": 3, "d": 4, "e": 5})
+        sortedset_client.zadd("test", FIVE)
         result = sortedset_client.zrangebyscore("test", 2, 4)
         assert result == ["b", "c", "d"]
 
@@ -123,33 +409,65 @@ class TestZRangeByScore:
 
     def test_zrangebyscore_no_matches(self, sortedset_client):
         """Test zrangebyscore with no matching scores."""
-        sortedset_client.zadd("test", {"a": 1, "b": 2, "c": 3})
+        sortedset_client.zadd("test", THREE)
         result = sortedset_client.zrangebyscore("test", 10, 20)
         assert result == []
 
+    def test_zrangebyscore_negative_scores(self, sortedset_client):
+        """Test that negative scores sort and range correctly."""
+        sortedset_client.zadd("test", {"a": -10, "b": -1.5, "c": 0, "d": 2, "e": -0.0})
+        assert sortedset_client.zrange("test", 0, -1) == ["a", "b", "c", "e", "d"]
+        assert sortedset_client.zrangebyscore("test", -5, 0) == ["b", "c", "e"]
+        assert sortedset_client.zcount("test", float("-inf"), -1) == 2
+
 
 class TestZRem:
     """Test zrem operation."""
 
-    def test_zrem_single_member(self, sortedset_client):
-        """Test removing a single member."""
-        sortedset_client.zadd("test", {"a": 1, "b": 2, "c": 3})
-        result = sortedset_client.zrem("test", "b")
-        assert result == 1
-        assert sortedset_client.zcard("test") == 2
-
-    def test_zrem_multiple_members(self, sortedset_client):
-        """Test removing multiple members."""
+    @pytest.mark.parametrize(
+        "members,expected,remaining",
+        [
+            (("b",), 1, ["a", "c", "d"]),
+            (("a", "c", "d"), 3, ["b"]),
+            (("nonexistent",), 0, ["a", "b", "c", "d"]),
+        ],
+        ids=["single", "multiple", "nonexistent"],
+    )
+    def test_zrem_members(self, sortedset_client, members, expected, remaining):
+        """Test removing one, several or missing members."""
         sortedset_client.zadd("test", {"a": 1, "b": 2, "c": 3, "d": 4})
-        result = sortedset_client.zrem("test", "a", "c", "d")
-        assert result == 3
-        assert sortedset_client.zcard("test") == 1
+        assert sortedset_client.zrem("test", *members) == expected
+        assert sortedset_client.zrange("test", 0, -1) == remaining
+        assert sortedset_client.zcard("test") == len(remaining)
+
+    def test_zrem_repeated_and_missing_members(self, sortedset_client):
+        """Test that repeated members count once and missing sets remove nothing."""
+        sortedset_client.zadd("test", THREE)
+        assert sortedset_client.zrem("test", "a", "a", "x", "c") == 2
+        assert sortedset_client.zrange("test", 0, -1) == ["b"]
+        assert sortedset_client.zrem("missing", "a") == 0
+
+    def test_zrem_without_matches_skips_write(self, sortedset_client):
+        """Test that removing only missing members does not commit a write."""
+        sortedset_client.zadd("test", {"a": 1})
+        last_txn = sortedset_client.env.info()["last_txnid"]
+        assert sortedset_client.zrem("test", "x", "y") == 0
+        assert sortedset_client.env.info()["last_txnid"] == last_txn
 
-    def test_zrem_nonexistent_member(self, sortedset_client):
-        """Test removing a nonexistent member."""
+    def test_none_member_rejected(self, sortedset_client):
+        """Test that None members raise a clear error instead of a TypeError."""
         sortedset_client.zadd("test", {"a": 1})
-        result = sortedset_client.zrem("test", "nonexistent")
-        assert result == 0
+        for call in (
+            lambda: sortedset_client.zrem("test", None),
+            lambda: sortedset_client.zscore("test", None),
+            lambda: sortedset_client.zmscore("test", "a", None),
+            lambda: sortedset_client.zrank("test", None),
+            lambda: sortedset_client.zincrby("test", None),
+            lambda: sortedset_client.zadd("test", {None: 2}),
+        ):
+            with pytest.raises(ValueError, match="None"):
+                call()
+        assert sortedset_client.zrange("test", 0, -1) == ["a"]
 
 
 class TestZCard:
@@ -157,13 +475,40 @@ class TestZCard:
 
     def test_zcard_basic(self, sortedset_client):
         """Test getting cardinality."""
-        sortedset_client.zadd("test", {"a": 1, "b": 2, "c": 3})
+        sortedset_client.zadd("test", THREE)
         assert sortedset_client.zcard("test") == 3
 
     def test_zcard_empty_set(self, sortedset_client):
         """Test cardinality of empty set."""
         assert sortedset_client.zcard("nonexistent") == 0
 
+    def test_zcard_tracks_writes(self, sortedset_client):
+        """Test that the stored count follows every kind of write."""
+        sortedset_client.zadd("test", {"a": 1, "b": 2, "c": 3, "d": 4, "e": 5, "f": 6})
+        sortedset_client.zadd("test", {"a": 10})
+        sortedset_client.zincrby("test", "g", 7)
+        assert sortedset_client.zcard("test") == 7
+
+        sortedset_client.zrem("test", "a", "missing")
+        sortedset_client.zremrangebyscore("test", 2, 3)
+        sortedset_client.zpopmin("test")
+        sortedset_client.zpopmax("test")
+        assert sortedset_client.zcard("test") == 2
+        assert sortedset_client.zrange("test", 0, -1) == ["e", "f"]
+
+        sortedset_client.delete("test")
+        assert sortedset_client.zcard("test") == 0
+
+    def test_zcard_rebuilds_missing_counters(self, temp_db_path):
+        """Test that counters are rebuilt for data written without them."""
+        with LMDBSortedSet(path=temp_db_path) as client:
+            client.zadd("test", {"a": 1, "b": 2})
+            with client.env.begin(write=True) as txn:
+                txn.drop(client.count_db, delete=False)
+
+        with LMDBSortedSet(path=temp_db_path) as client:
+            assert client.zcard("test") == 2
+
 
 class TestZScore:
     """Test zscore operation."""
@@ -180,21 +525,78 @@ class TestZScore:
         score = sortedset_client.zscore("test", "nonexistent")
         assert score is None
 
+    def test_zscore_after_update_and_removal(self, sortedset_client):
+        """Test that the member index follows score updates and removals."""
+        sortedset_client.zadd("test", {"a": 1, "b": 2})
+        sortedset_client.zadd("test", {"a": 5})
+        sortedset_client.zincrby("test", "b", 3)
+        sortedset_client.zrem("test", "a")
+        assert sortedset_client.zscore("test", "a") is None
+        assert sortedset_client.zscore("test", "b") == 5.0
+        assert sortedset_client.zrange("test", 0, -1, withscores=True) == [("b", 5.0)]
+
+    def test_zscore_rebuilds_member_index(self, temp_db_path):
+        """Test that the member index is rebuilt for data written without it."""
+        with LMDBSortedSet(path=temp_db_path) as client:
+            client.zadd("test", {"a": 1, "b": 2})
+            with client.env.begin(write=True) as txn:
+                txn.drop(client.member_db, delete=False)
+
+        with LMDBSortedSet(path=temp_db_path) as client:
+            assert client.zscore("test", "b") == 2.0
+            assert client.zrem("test", "a") == 1
+            assert client.zrange("test", 0, -1) == ["b"]
+
+
+class TestZMScore:
+    """Test zmscore operation."""
+
+    def test_zmscore_in_argument_order(self, sortedset_client):
+        """Test that scores come back in argument order with None for missing members."""
+        sortedset_client.zadd("test", THREE)
+        assert sortedset_client.zmscore("test", "c", "missing", "a", "c") == [3.0, None, 1.0, 3.0]
+
+    def test_zmscore_missing_set(self, sortedset_client):
+        """Test zmscore on a set that does not exist."""
+        assert sortedset_client.zmscore("missing", "a", "b") == [None, None]
+
+
+class TestZRank:
+    """Test zrank operation."""
+
+    def test_zrank_existing_member(self, sortedset_client):
+        """Test getting the rank of existing members."""
+        sortedset_client.zadd("test", THREE)
+        assert sortedset_client.zrank("test", "a") == 0
+        assert sortedset_client.zrank("test", "c") == 2
+
+    def test_zrank_nonexistent_member(self, sortedset_client):
+        """Test that a missing member has no rank."""
+        sortedset_client.zadd("test", {"a": 1})
+        assert sortedset_client.zrank("test", "nonexistent") is None
+
 
 class TestZCount:
     """Test zcount operation."""
 
-    def test_zcount_basic(self, sortedset_client):
-        """Test counting members in score range."""
-        sortedset_client.zadd("test", {"a": 1, "b": 2, "c": 3, "d": 4, "e": 5})
-        count = sortedset_client.zcount("test", 2, 4)
-        assert count == 3
-
-    def test_zcount_no_matches(self, sortedset_client):
-        """Test zcount with no matches."""
-        sortedset_client.zadd("test", {"a": 1, "b": 2})
-        count = sortedset_client.zcount("test", 10, 20)
-        assert count == 0
+    @pytest.mark.parametrize(
+        "min_score,max_score,expected",
+        [(2, 4, 3), (10, 20, 0), (-5, 0, 0)],
+        ids=["basic", "above", "below"],
+    )
+    def test_zcount_range(self, sortedset_client, min_score, max_score, expected):
+        """Test counting members in a score range."""
+        sortedset_client.zadd("test", FIVE)
+        assert sortedset_client.zcount("test", min_score, max_score) == expected
+
+    def test_zcount_includes_members_at_bounds(self, sortedset_client):
+        """Test that every member scored exactly min or max is counted."""
+        sortedset_client.zadd_many(
+            {"test": {"a": 1, "b": 2, "c": 2, "d": 3, "e": 3}, "test2": {"x": 2}}
+        )
+        assert sortedset_client.zcount("test", 2, 3) == 4
+        assert sortedset_client.zrangebyscore("test", 2, 2) == ["b", "c"]
+        assert sortedset_client.zcount("test", 3, 2) == 0
 
 
 class TestZRemRangeByScore:
@@ -202,7 +604,7 @@ class TestZRemRangeByScore:
 
     def test_zremrangebyscore_basic(self, sortedset_client):
         """Test removing members by score range."""
-        sortedset_client.zadd("test", {"a": 1, "b": 2, "c": 3, "d": 4, "e": 5})
+        sortedset_client.zadd("test", FIVE)
         removed = sortedset_client.zremrangebyscore("test", 2, 4)
         assert removed == 3
         assert sortedset_client.zcard("test") == 2
@@ -217,37 +619,67 @@ class TestZRemRangeByScore:
 class TestZPopMin:
     """Test zpopmin operation."""
 
-    def test_zpopmin_single(self, sortedset_client):
-        """Test popping minimum member."""
-        sortedset_client.zadd("test", {"a": 1, "b": 2, "c": 3})
-        result = sortedset_client.zpopmin("test")
-        assert result == [("a", 1.0)]
-        assert sortedset_client.zcard("test") == 2
-
-    def test_zpopmin_multiple(self, sortedset_client):
-        """Test popping multiple minimum members."""
-        sortedset_client.zadd("test", {"a": 1, "b": 2, "c": 3, "d": 4})
-        result = sortedset_client.zpopmin("test", count=2)
-        assert result == [("a", 1.0), ("b", 2.0)]
-        assert sortedset_client.zcard("test") == 2
+    @pytest.mark.parametrize(
+        "count,expected",
+        [(1, [("a", 1.0)]), (2, [("a", 1.0), ("b", 2.0)])],
+        ids=["single", "multiple"],
+    )
+    def test_zpopmin_count(self, populated_test_set, count, expected):
+        """Test popping one or more minimum members."""
+        assert populated_test_set.zpopmin("test", count=count) == expected
+        assert populated_test_set.zcard("test") == 4 - count
 
 
 class TestZPopMax:
     """Test zpopmax operation."""
 
-    def test_zpopmax_single(self, sortedset_client):
-        """Test popping maximum member."""
-        sortedset_client.zadd("test", {"a": 1, "b": 2, "c": 3})
-        result = sortedset_client.zpopmax("test")
-        assert result == [("c", 3.0)]
+    @pytest.mark.parametrize(
+        "count,expected",
+        [(1, [("d", 4.0)]), (2, [("d", 4.0), ("c", 3.0)])],
+        ids=["single", "multiple"],
+    )
+    def test_zpopmax_count(self, populated_test_set, count, expected):
+        """Test popping one or more maximum members."""
+        assert populated_test_set.zpopmax("test", count=count) == expected
+        assert populated_test_set.zcard("test") == 4 - count
+
+    def test_zpopmax_whole_set_between_neighbours(self, sortedset_client):
+        """Test popping past the start of a set leaves neighbouring sets intact."""
+        sortedset_client.zadd_many({"a": {"x": 1}, "b": {"p": 1, "q": 2, "r": 3}, "c": {"y": 1}})
+        assert sortedset_client.zpopmax("b", count=10) == [("r", 3.0), ("q", 2.0), ("p", 1.0)]
+        assert sortedset_client.zcard("b") == 0
+        assert sortedset_client.zpopmax("c") == [("y", 1.0)]
+        assert sortedset_client.zpopmax("a", count=2) == [("x", 1.0)]
+
+    def test_zpopmax_non_positive_count(self, sortedset_client):
+        """Test that a count of zero or less pops nothing."""
+        sortedset_client.zadd("test", {"a": 1, "b": 2})
+        assert sortedset_client.zpopmax("test", count=0) == []
+        assert sortedset_client.zpopmax("test", count=-1) == []
         assert sortedset_client.zcard("test") == 2
 
-    def test_zpopmax_multiple(self, sortedset_client):
-        """Test popping multiple maximum members."""
-        sortedset_client.zadd("test", {"a": 1, "b": 2, "c": 3, "d": 4})
-        result = sortedset_client.zpopmax("test", count=2)
-        assert result == [("d", 4.0), ("c", 3.0)]
-        assert sortedset_client.zcard("test") == 2
+
+class TestZPeek:
+    """Test zpeekmin and zpeekmax operations."""
+
+    def test_zpeekmin(self, sortedset_client):
+        """Test reading minimum members without removing them."""
+        sortedset_client.zadd("test", THREE)
+        assert sortedset_client.zpeekmin("test", count=2) == [("a", 1.0), ("b", 2.0)]
+        assert sortedset_client.zcard("test") == 3
+
+    def test_zpeekmax(self, sortedset_client):
+        """Test reading maximum members without removing them."""
+        sortedset_client.zadd_many({"test": THREE, "testz": {"x": 10}})
+        assert sortedset_client.zpeekmax("test", count=2) == [("c", 3.0), ("b", 2.0)]
+        assert sortedset_client.zpeekmax("testz") == [("x", 10.0)]
+        assert sortedset_client.zcard("test") == 3
+
+    def test_zpeek_empty_set(self, sortedset_client):
+        """Test peeking at a nonexistent set."""
+        sortedset_client.zadd("other", {"a": 1})
+        assert sortedset_client.zpeekmin("nonexistent") == []
+        assert sortedset_client.zpeekmax("nonexistent") == []
 
 
 class TestDelete:
@@ -265,14 +697,26 @@ class TestDelete:
         result = sortedset_client.delete("nonexistent")
         assert result is False
 
+    def test_delete_leaves_neighbouring_sets(self, sortedset_client):
+        """Test that deleting in place stops at the end of the set."""
+        sortedset_client.zadd_many(
+            {"a": {"x": 1}, "b": {str(i): i for i in range(50)}, "c": {"y": 1}}
+        )
+
+        assert sortedset_client.delete("b") is True
+        assert sortedset_client.zscore("b", "10") is None
+        assert sortedset_client.zrange("a", 0, -1) == ["x"]
+        assert sortedset_client.zrange("c", 0, -1) == ["y"]
+        assert sortedset_client.delete("c") is True
+        assert sortedset_client.zpopmin("a", 5) == [("x", 1.0)]
+
 
 class TestMultipleSortedSets:
     """Test operations on multiple sorted sets."""
 
     def test_multiple_sets(self, sortedset_client):
         """Test that multiple sorted sets are independent."""
-        sortedset_client.zadd("set1", {"a": 1, "b": 2})
-        sortedset_client.zadd("set2", {"x": 10, "y": 20})
+        sortedset_client.zadd_many({"set1": {"a": 1, "b": 2}, "set2": {"x": 10, "y": 20}})
 
         assert sortedset_client.zcard("set1") == 2
         assert sortedset_client.zcard("set2") == 2
@@ -280,7 +724,144 @@ class TestMultipleSortedSets:
         assert sortedset_client.zrange("set1", 0, -1) == ["a", "b"]
         assert sortedset_client.zrange("set2", 0, -1) == ["x", "y"]
 
+    def test_key_sharing_a_prefix(self, sortedset_client):
+        """Test that a set is not hidden by another whose key extends its name."""
+        sortedset_client.zadd_many({"test": {"a": 1, "b": 2}, "test2": {"x": 10}})
+
+        assert sortedset_client.zrank("test", "b") == 1
+        assert sortedset_client.zpopmin("test") == [("a", 1.0)]
+        assert sortedset_client.zpeekmax("test") == [("b", 2.0)]
+        assert sortedset_client.delete("test") is True
+        assert sortedset_client.zrange("test2", 0, -1) == ["x"]
+
 
+class TestPipeline:
+    """Test pipelined command execution."""
+
+    def test_pipeline_execute_returns_results(self, sortedset_client):
+        """Test that execute returns each command's result in order."""
+        with sortedset_client.pipeline() as pipe:
+            pipe.zadd("test", THREE)
+            pipe.zremrangebyscore("test", 0, 1)
+            pipe.zcard("test")
+            pipe.zrange("test", 0, -1)
+            result = pipe.execute()
+
+        assert result == [3, 1, 2, ["b", "c"]]
+        assert len(pipe) == 0
+
+    def test_pipeline_executes_on_exit(self, sortedset_client):
+        """Test that pending commands run when the with block exits."""
+        with sortedset_client.pipeline() as pipe:
+            pipe.zadd("test", {"a": 1}).zadd("test", {"b": 2})
+
+        assert sortedset_client.zrange("test", 0, -1) == ["a", "b"]
+
+    def test_pipeline_discarded_on_error(self, sortedset_client):
+        """Test that queued commands are dropped if the with block raises."""
+        with pytest.raises(RuntimeError):
+            with sortedset_client.pipeline() as pipe:
+                pipe.zadd("test", {"a": 1})
+                raise RuntimeError("boom")
+
+        assert sortedset_client.zcard("test") == 0
+
+
+class TestReadBatch:
+    """Test sharing one read transaction across read calls."""
+
+    def test_read_batch_reads(self, sortedset_client):
+        """Test that read methods accept the batch transaction."""
+        sortedset_client.zadd("test", THREE)
+        with sortedset_client.read_batch() as txn:
+            assert sortedset_client.zcard("test", txn=txn) == 3
+            assert sortedset_client.zscore("test", "b", txn=txn) == 2.0
+            assert sortedset_client.zrange("test", 0, 0, txn=txn) == ["a"]
+            assert sortedset_client.zrangebyscore("test", 2, 3, txn=txn) == ["b", "c"]
+            assert sortedset_client.zpeekmax("test", txn=txn) == [("c", 3.0)]
+
+    def test_read_batch_is_a_snapshot(self, sortedset_client):
+        """Test that writes after the batch starts are not visible inside it."""
+        sortedset_client.zadd("test", {"a": 1})
+        with sortedset_client.read_batch() as txn:
+            sortedset_client.zadd("test", {"b": 2})
+            assert sortedset_client.zcard("test", txn=txn) == 1
+        assert sortedset_client.zcard("test") == 2
+
+    def test_read_batch_across_sub_databases(self, temp_db_path):
+        """Test that a batch transaction from one db_name reads another's data correctly."""
+        with LMDBSortedSet(path=temp_db_path, db_name="one") as a:
+            with LMDBSortedSet(path=temp_db_path, db_name="two") as b:
+                a.zadd("s", {"a1": 1, "a2": 2})
+                b.zadd("s", {"b1": 1, "b2": 2, "b3": 3})
+                with a.read_batch() as txn:
+                    assert b.zrange("s", 0, -1, txn=txn) == ["b1", "b2", "b3"]
+                    assert b.zrangebyscore("s", 2, 3, txn=txn) == ["b2", "b3"]
+                    assert b.zcard("s", txn=txn) == 3
+                    assert b.zrank("s", "b2", txn=txn) == 1
+                    assert b.zcount("s", 1, 2, txn=txn) == 2
+                    assert b.zpeekmin("s", txn=txn) == [("b1", 1.0)]
+                    assert b.zpeekmax("s", txn=txn) == [("b3", 3.0)]
+
+
+class TestSerializer:
+    """Test the tagged member serializers."""
+
+    @pytest.mark.parametrize("serializer", ["orjson", "msgpack"])
+    def test_members_keep_their_type(self, temp_db_path, serializer):
+        """Test that tagged members decode to their original types."""
+        pytest.importorskip(serializer)
+        with LMDBSortedSet(path=temp_db_path, serializer=serializer) as client:
+            client.zadd("test", {"a": 1, 7: 2, b"raw": 3})
+            client.zadd_bulk("test", [{"id": 1}, [1, 2]], [4, 5])
+            assert client.zrange("test", 0, -1) == ["a", 7, b"raw", {"id": 1}, [1, 2]]
+            assert client.zscore("test", {"id": 1}) == 4.0
+            assert client.zrem("test", 7, [1, 2]) == 2
+
+    def test_json_values_round_trip_with_stdlib(self):
+        """Test that JSON written by encode_value parses back exactly."""
+        value = decode_value(encode_value([2**70, float("inf")]), as_json=True)
+        assert value == [2**70, float("inf")]
+        assert isinstance(value[0], int)
+
+    def test_serializer_mismatch_rejected(self, temp_db_path):
+        """Test that sets cannot be reopened with a different serializer."""
+        pytest.importorskip("orjson")
+        with LMDBSortedSet(path=temp_db_path) as client:
+            client.zadd("s", {"Sam": 1, "Bob": 2})
+
+        with pytest.raises(LMDBInitError, match="'json' serializer"):
+            LMDBSortedSet(path=temp_db_path, serializer="orjson")
+        with pytest.raises(LMDBInitError, match="'json' serializer"):
+            LMDBSortedSet(path=temp_db_path, serializer="orjson", readonly=True)
+
+        # Each db_name records its own serializer
+        with LMDBSortedSet(path=temp_db_path, db_name="tagged", serializer="orjson") as client:
+            client.zadd("s", {"Sam": 1})
+        with LMDBSortedSet(path=temp_db_path) as client:
+            assert client.zrange("s", 0, -1) == ["Sam", "Bob"]
+
+    def test_unknown_serializer(self, temp_db_path):
+        """Test that an unknown serializer is rejected before opening LMDB."""
+        with pytest.raises(ValueError):
+            LMDBSortedSet(path=temp_db_path, serializer="pickle")
+
+
+class TestExceptions:
+    """Test exception helpers."""
+
+    def test_from_rc_known_code(self):
+        """Test building an error from a known LMDB return code."""
+        error = LMDBOperationError.from_rc(-30792)
+        assert isinstance(error, LMDBOperationError)
+        assert "MDB_MAP_FULL" in str(error)
+
+    def test_from_rc_unknown_code(self):
+        """Test building an error from an unknown return code."""
+        assert str(LMDBOperationError.from_rc(-1)) == "LMDB error code -1"
+
+
+@pytest.mark.xdist_group("persistence")
 class TestPersistence:
     """Test data persistence across client instances."""
 
@@ -288,13 +869,95 @@ class TestPersistence:
         """Test that data persists after closing and reopening."""
         # Write data
         with LMDBSortedSet(path=temp_db_path) as client:
-            client.zadd("test", {"a": 1, "b": 2, "c": 3})
+            client.zadd("test", THREE)
 
         # Read data in new client
         with LMDBSortedSet(path=temp_db_path) as client:
             result = client.zrange("test", 0, -1)
             assert result == ["a", "b", "c"]
 
+    def test_sync_then_readonly_process(self, temp_db_path):
+        """Test that synced data is readable by a read-only client in another process."""
+        reader_script = (
+            "import json, sys\n"
+            "from lmdb_sortedset import LMDBSortedSet\n"
+            "with LMDBSortedSet(path=sys.argv[1], readonly=True) as reader:\n"
+            "    print(json.dumps([reader.env.flags()['readonly'],\n"
+            "                      reader.zrange('test', 0, -1, withscores=True)]))\n"
+        )
+        env = dict(os.environ, PYTHONPATH=str(Path(__file__).resolve().parents[1]))
+
+        with LMDBSortedSet(path=temp_db_path, sync=False) as client:
+            client.zadd("test", THREE)
+            client.sync()
+
+            result = subprocess.run(
+                [sys.executable, "-c", reader_script, temp_db_path],
+                capture_output=True,
+                text=True,
+                env=env,
+                check=True,
+            )
+
+        readonly, members = json.loads(result.stdout)
+        assert readonly is True
+        assert members == [["a", 1.0], ["b", 2.0], ["c", 3.0]]
+
+    def test_legacy_format_is_migrated(self, temp_db_path):
+        """Test that data in the 0.1 key format is rewritten on open."""
+        with LMDBSortedSet(path=temp_db_path) as client:
+            with client.env.begin(db=client.zset_db, write=True) as txn:
+                for member, score in (("a", 3), ("b", -2), ("c", 1)):
+                    txn.put(b"test:|:" + encode_score(score), member.encode("utf-8"))
+
+        with LMDBSortedSet(path=temp_db_path) as client:
+            assert client.zrange("test", 0, -1, withscores=True) == [
+                ("b", -2.0),
+                ("c", 1.0),
+                ("a", 3.0),
+            ]
+            assert client.zcard("test") == 3
+            assert client.zscore("test", "b") == -2.0
+            assert client.zrem("test", "a") == 1
+
+    def test_legacy_duplicate_members_are_merged(self, temp_db_path):
+        """Test that stale 0.1 entries for a member are dropped during migration."""
+        env = lmdb.open(temp_db_path, max_dbs=10)
+        with env.begin(db=env.open_db(b"zset"), write=True) as txn:
+            # 0.1 left alice's old entry behind when user:10 sat next to user:1
+            for key, member, score in (
+                (b"user:1", b"bob", 1),
+                (b"user:1", b"alice", 5),
+                (b"user:1", b"alice", 7),
+                (b"user:10", b"carol", 1),
+            ):
+                txn.put(key + b":|:" + encode_score(score), member)
+        env.close()
+
+        with LMDBSortedSet(path=temp_db_path) as client:
+            assert client.zrange("user:1", 0, -1, withscores=True) == [
+                ("bob", 1.0),
+                ("alice", 5.0),
+            ]
+            assert client.zcard("user:1") == 2
+            assert client.zrem("user:1", "alice") == 1
+            assert client.zrange("user:1", 0, -1) == ["bob"]
+            assert client.zrange("user:10", 0, -1, withscores=True) == [("carol", 1.0)]
+
+    def test_legacy_format_readonly_needs_migration(self, temp_db_path):
+        """Test that an unmigrated 0.1 database cannot be opened read-only."""
+        env = lmdb.open(temp_db_path, max_dbs=10)
+        with env.begin(db=env.open_db(b"zset"), write=True) as txn:
+            txn.put(b"test:|:" + encode_score(1), b"a")
+        env.close()
+
+        with pytest.raises(LMDBInitError, match="read-write once"):
+            LMDBSortedSet(path=temp_db_path, readonly=True)
+
+        LMDBSortedSet(path=temp_db_path).close()
+        with LMDBSortedSet(path=temp_db_path, readonly=True) as client:
+            assert client.zrange("test", 0, -1) == ["a"]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -4,6 +4,7 @@
 Verification script to test the LMDB SortedSet library.
 """
 
+import atexit
 import tempfile
 import shutil
 from pathlib import Path
@@ -25,6 +26,7 @@ except ImportError as e:
 # Test 2: Create a temporary database
 print("\n[2/6] Creating temporary database...")
 temp_dir = tempfile.mkdtemp()
+atexit.register(shutil.rmtree, temp_dir, ignore_errors=True)
 try:
     client = LMDBSortedSet(path=temp_dir)
     print(f"[PASS] Database created at: {temp_dir}")
@@ -108,21 +110,17 @@ except Exception as e:
 # Test 6: Context manager and cleanup
 print("\n[6/6] Testing context manager...")
 try:
-    client.close()
-
-    # Test context manager
-    with LMDBSortedSet(path=temp_dir) as ctx_client:
+    # Reuse the open client; leaving the block closes it
+    with client as ctx_client:
         ctx_client.zadd("ctx_test", {"a": 1})
         count = ctx_client.zcard("ctx_test")
         assert count == 1, f"Expected 1, got {count}"
 
+    assert client.env is None, "Expected the client to be closed"
     print("[PASS] Context manager working correctly")
 except Exception as e:
     print(f"[FAIL] Context manager failed: {e}")
     exit(1)
-finally:
-    # Cleanup
-    shutil.rmtree(temp_dir, ignore_errors=True)
 
 # Summary
 print("\n" + "=" * 60)